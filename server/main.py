@@ -5,6 +5,8 @@ forensic auditing pipeline over HTTP.
 """
 from __future__ import annotations
 
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -32,4 +34,14 @@ app.include_router(audit.router)
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("server.main:app", host="0.0.0.0", port=8000, reload=False, log_level="info")
+    uvicorn.run(
+        "server.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        # "auto" picks uvloop when it is installed (it is not on win32).
+        loop="auto",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY") or 1),
+        log_level="info",
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import List
 
 from fastapi import APIRouter, Body, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from pydantic import BaseModel, ConfigDict
 
 from server.services import engine
@@ -49,7 +49,7 @@ class AuditReport(BaseModel):
     governance: dict
 
 
-async def _validate_inputs(files: List[UploadFile], text: str | None, url: str | None) -> None:
+def _validate_inputs(files: List[UploadFile], text: str | None, url: str | None) -> None:
     """Enforce strict input requirements for AEP-001 compliance."""
 
     if not files and not (text and text.strip()) and not (url and url.strip()):
@@ -67,13 +67,13 @@ async def run_audit(
 ) -> AuditReport:
     """Run the deterministic Tessrax audit core on supplied inputs."""
 
-    await _validate_inputs(files, text, url)
+    _validate_inputs(files, text, url)
 
-    artifacts = await engine.ingest_data(files=files, text=text, url=url)
+    artifacts, counts = await engine.ingest_data(files=files, text=text, url=url)
     result = engine.run_engine(artifacts)
 
-    counts = engine.count_artifacts(artifacts)
-    summary = SummaryStats(
+    # The engine is a trusted producer; response_model still validates the outgoing shape.
+    summary = SummaryStats.model_construct(
         artifact_count=len(artifacts),
         file_count=counts["file"],
         text_present=counts["text"] > 0,
@@ -81,18 +81,25 @@ async def run_audit(
         merkle_root=result["merkleRoot"],
     )
 
-    return AuditReport(
+    return AuditReport.model_construct(
         auditId=result["auditId"],
         merkleRoot=result["merkleRoot"],
         summary=summary,
-        contradictions=[Contradiction(**item) for item in result["contradictions"]],
+        contradictions=[
+            Contradiction.model_construct(
+                location=item["location"],
+                description=item["description"],
+                severity=item["severity"],
+            )
+            for item in result["contradictions"]
+        ],
         findings=list(result.get("findings", [])),
         governance=GOVERNANCE_METADATA,
     )
 
 
-@router.post("/audit/pdf", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
-async def generate_audit_pdf(report: dict = Body(..., embed=False)) -> StreamingResponse:
+@router.post("/audit/pdf", response_class=Response, status_code=status.HTTP_200_OK)
+async def generate_audit_pdf(report: dict = Body(..., embed=False)) -> Response:
     """Generate a deterministic PDF for a supplied audit report."""
 
     if not isinstance(report, dict):
@@ -118,8 +125,8 @@ async def generate_audit_pdf(report: dict = Body(..., embed=False)) -> Streaming
     generator = ForensicReportPDF(ledger_id=str(merkle_root))
     pdf_bytes = generator.generate(report)
 
-    return StreamingResponse(
-        content=pdf_bytes,
+    return Response(
+        content=bytes(pdf_bytes),
         media_type="application/pdf",
         headers={"Content-Disposition": "attachment; filename=audit-report.pdf"},
     )
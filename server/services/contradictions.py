@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 GOVERNANCE_METADATA = {
     "auditor": "Tessrax Governance Kernel v16",
@@ -58,6 +58,25 @@ def _text_from_artifact(artifact: Dict[str, Any]) -> str:
     return text
 
 
+def unique_artifacts(artifacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeats of an earlier artifact with the same type and sha256, keeping first occurrences.
+
+    Artifacts without a digest are always kept.
+    """
+
+    seen: Set[Tuple[Any, str]] = set()
+    unique: List[Dict[str, Any]] = []
+    for artifact in artifacts:
+        digest = artifact.get("sha256") if isinstance(artifact, dict) else None
+        if digest is not None:
+            key = (artifact.get("type"), digest)
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(artifact)
+    return unique
+
+
 def _artifact_name(artifact: Dict[str, Any]) -> str:
     raw = artifact.get("name") or artifact.get("type") or "artifact"
     return str(raw)
@@ -124,7 +143,7 @@ def detect_conflicts(artifacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not artifacts:
         raise ArtifactValidationError("detect_conflicts requires at least one artifact input")
 
-    sorted_artifacts = sorted(artifacts, key=_artifact_name)
+    sorted_artifacts = sorted(unique_artifacts(artifacts), key=_artifact_name)
     artifact_terms: List[Dict[str, Any]] = []
     for artifact in sorted_artifacts:
         text = _text_from_artifact(artifact)
@@ -203,5 +222,6 @@ __all__ = [
     "GOVERNANCE_METADATA",
     "extract_terms",
     "detect_conflicts",
+    "unique_artifacts",
     "ArtifactValidationError",
 ]
@@ -3,9 +3,9 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from server.services.contradictions import detect_conflicts
+from server.services.contradictions import detect_conflicts, unique_artifacts
 
 try:  # AEP-001: validate serialization imports eagerly.
     from tessrax.core.serialization import canonical_serialize, canonical_payload_hash
@@ -55,20 +55,43 @@ def _sha256_digest(raw: bytes) -> str:
     return digest
 
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _upload_digest(upload: Any) -> Tuple[int, str]:
+    """Stream an upload through SHA-256, returning its byte length and digest."""
+
+    hasher = hashlib.sha256()
+    length = 0
+    while True:
+        chunk = await upload.read(_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        hasher.update(chunk)
+        length += len(chunk)
+    return length, hasher.hexdigest()
+
+
 def _prepare_artifact(base: Dict[str, Any]) -> Dict[str, Any]:
     """Normalise artifact structure for serialization."""
 
     if "sha256" not in base:
         raise ValueError("All artifacts must include a sha256 digest before serialization")
-    ordered = dict(sorted(base.items(), key=lambda item: item[0]))
-    ordered["__integrity__"] = canonical_payload_hash({"sha256": ordered["sha256"], "type": ordered["type"]})
-    return ordered
+    # Key order is irrelevant here: canonical serialization sorts keys downstream.
+    base["__integrity__"] = canonical_payload_hash({"sha256": base["sha256"], "type": base["type"]})
+    return base
 
 
-async def ingest_data(files: List[Any], text: str | None, url: str | None) -> List[Dict[str, Any]]:
-    """Ingest heterogeneous inputs into deterministic artifact records."""
+async def ingest_data(
+    files: List[Any], text: str | None, url: str | None
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Ingest heterogeneous inputs into deterministic artifact records.
+
+    Returns the artifacts together with per-type counts tallied during ingestion.
+    """
 
     artifacts: List[Dict[str, Any]] = []
+    counts = {"file": 0, "text": 0, "url": 0}
 
     if text and text.strip():
         normalized = text.strip()
@@ -82,6 +105,7 @@ async def ingest_data(files: List[Any], text: str | None, url: str | None) -> Li
                 }
             )
         )
+        counts["text"] += 1
 
     if url and url.strip():
         normalized_url = url.strip()
@@ -95,26 +119,26 @@ async def ingest_data(files: List[Any], text: str | None, url: str | None) -> Li
                 }
             )
         )
+        counts["url"] += 1
 
     for upload in files:
-        content = await upload.read()
-        if content is None:
-            content = b""
+        length, digest = await _upload_digest(upload)
         artifacts.append(
             _prepare_artifact(
                 {
                     "type": "file",
                     "name": upload.filename or "unnamed",
-                    "length": len(content),
-                    "sha256": _sha256_digest(content),
+                    "length": length,
+                    "sha256": digest,
                 }
             )
         )
+        counts["file"] += 1
 
     if not artifacts:
         raise ValueError("ingest_data requires at least one non-empty artifact input")
 
-    return artifacts
+    return artifacts, counts
 
 
 def run_deterministic_core(artifacts: List[Dict[str, Any]]) -> str:
@@ -122,6 +146,7 @@ def run_deterministic_core(artifacts: List[Dict[str, Any]]) -> str:
 
     if not artifacts:
         raise ValueError("run_deterministic_core cannot operate on an empty artifact list")
+    artifacts = unique_artifacts(artifacts)
 
     normalized_blocks = [canonical_serialize(artifact) for artifact in artifacts]
     assert all(block for block in normalized_blocks), "Canonical serialization produced empty payload"
@@ -165,18 +190,10 @@ def run_engine(artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
     return response
 
 
-def count_artifacts(artifacts: List[Dict[str, Any]]) -> Dict[str, int]:
-    counts = {"file": 0, "text": 0, "url": 0}
-    for artifact in artifacts:
-        counts[artifact["type"]] += 1
-    return counts
-
-
 __all__ = [
     "GOVERNANCE_METADATA",
     "ingest_data",
     "run_deterministic_core",
     "detect_contradictions",
     "run_engine",
-    "count_artifacts",
 ]
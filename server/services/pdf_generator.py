@@ -1,13 +1,19 @@
 """Professional forensic PDF generator for audit findings."""
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
 
 from server.services.engine import GOVERNANCE_METADATA
 
+# "Arial" is only an alias fpdf2 maps onto the core Helvetica font, with a
+# deprecation warning (and a stack walk) on every set_font call.
+FONT_FAMILY = "helvetica"
+
 
 class ForensicReportPDF(FPDF):
     """Structured PDF builder for audit reports with integrity guarantees."""
@@ -22,13 +28,13 @@ class ForensicReportPDF(FPDF):
         self.set_title("Proceduralist Audit Record")
 
     def header(self) -> None:  # pragma: no cover - exercised indirectly via generate
-        self.set_font("Arial", "B", 15)
+        self.set_font(FONT_FAMILY, "B", 15)
         self.set_text_color(37, 99, 235)
         self.cell(80)
         self.cell(30, 10, "PROCEDURALIST", 0, 0, "C")
         self.ln(8)
 
-        self.set_font("Arial", "I", 8)
+        self.set_font(FONT_FAMILY, "I", 8)
         self.set_text_color(128, 128, 128)
         timestamp = self.generated_at.strftime("%Y-%m-%d %H:%M")
         self.cell(0, 10, f"Cryptographic Audit Record - Generated {timestamp}", 0, 0, "C")
@@ -36,40 +42,57 @@ class ForensicReportPDF(FPDF):
 
     def footer(self) -> None:  # pragma: no cover - exercised indirectly via generate
         self.set_y(-15)
-        self.set_font("Arial", "I", 8)
+        self.set_font(FONT_FAMILY, "I", 8)
         self.set_text_color(128, 128, 128)
         self.cell(0, 10, f"Page {self.page_no()} - Ledger {self.ledger_id}", 0, 0, "C")
 
     def chapter_title(self, label: str) -> None:
-        self.set_font("Arial", "B", 12)
+        self.set_font(FONT_FAMILY, "B", 12)
         self.set_fill_color(240, 245, 255)
         self.set_text_color(0, 0, 0)
         self.cell(0, 10, f"  {label}", 0, 1, "L", 1)
         self.ln(4)
 
     def chapter_body(self, body: str) -> None:
-        self.set_font("Arial", "", 10)
+        self.set_font(FONT_FAMILY, "", 10)
         self.multi_cell(0, 6, body)
         self.ln()
 
     def add_contradiction(self, contradiction: Dict[str, Any]) -> None:
-        self.set_font("Arial", "B", 10)
-        self.set_text_color(220, 53, 69)
+        self.add_contradictions([contradiction])
+
+    def add_contradictions(self, contradictions: List[Dict[str, Any]]) -> None:
+        """Render contradictions with all row text prepared before any cell is laid out."""
+
+        rows = [self._contradiction_lines(item) for item in contradictions]
+        # Indent by moving the cursor rather than rendering blank spacer cells.
+        indent = self.l_margin + 10
+        for heading, source_a, source_b in rows:
+            self.set_font(FONT_FAMILY, "B", 10)
+            self.set_text_color(220, 53, 69)
+            self.cell(0, 8, heading, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+            self.set_font(FONT_FAMILY, "", 10)
+            self.set_text_color(0, 0, 0)
+            self.set_x(indent)
+            self.cell(0, 6, source_a, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_x(indent)
+            self.cell(0, 6, source_b, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(4)
+
+    @staticmethod
+    def _contradiction_lines(contradiction: Dict[str, Any]) -> Tuple[str, str, str]:
         ctype = str(contradiction.get("type", "UNKNOWN")).upper()
         severity = str(contradiction.get("severity", "info")).upper()
-        self.cell(0, 8, f"TYPE: {ctype} ({severity})", 0, 1)
-
-        self.set_font("Arial", "", 10)
-        self.set_text_color(0, 0, 0)
         doc_a = contradiction.get("docA") or {}
         doc_b = contradiction.get("docB") or {}
-        self.cell(10)
-        self.cell(0, 6, f"Source A ({doc_a.get('name', 'unknown')}): {doc_a.get('text', '')}", 0, 1)
-        self.cell(10)
-        self.cell(0, 6, f"Source B ({doc_b.get('name', 'unknown')}): {doc_b.get('text', '')}", 0, 1)
-        self.ln(4)
+        return (
+            f"TYPE: {ctype} ({severity})",
+            f"Source A ({doc_a.get('name', 'unknown')}): {doc_a.get('text', '')}",
+            f"Source B ({doc_b.get('name', 'unknown')}): {doc_b.get('text', '')}",
+        )
 
-    def generate(self, report_data: Dict[str, Any]) -> bytes:
+    def generate(self, report_data: Dict[str, Any]) -> bytearray:
         self._validate_report(report_data)
         summary = report_data["summary"]
         contradictions: List[Dict[str, Any]] = list(report_data.get("contradictions", []))
@@ -83,18 +106,17 @@ class ForensicReportPDF(FPDF):
 
         self.chapter_title("Critical Findings")
         if contradictions:
-            for item in contradictions:
-                self.add_contradiction(item)
+            self.add_contradictions(contradictions)
         else:
             self.chapter_body("No contradictions detected.")
 
         self.ln(20)
-        self.set_font("Arial", "B", 10)
+        self.set_font(FONT_FAMILY, "B", 10)
         self.cell(0, 10, "_" * 50, 0, 1)
         self.cell(0, 5, "Authorized Signature", 0, 1)
 
-        rendered_raw = self.output(dest="S")
-        rendered = bytes(rendered_raw) if isinstance(rendered_raw, (bytes, bytearray)) else str(rendered_raw).encode("latin-1")
+        # fpdf2 returns its internal output buffer; hand it on without copying.
+        rendered = self.output()
         assert rendered, "PDF generation must emit non-empty bytes"
         return rendered
 
@@ -122,7 +144,7 @@ class ForensicReportPDF(FPDF):
             raise ValueError("report_data must include a contradictions array")
 
 
-def generate_pdf(report_data: Dict[str, Any]) -> Tuple[bytes, str]:
+def generate_pdf(report_data: Dict[str, Any]) -> Tuple[bytearray, str]:
     """Create a forensic PDF and return the bytes and SHA-256 digest."""
 
     generator = ForensicReportPDF(ledger_id=str(report_data.get("summary", {}).get("merkle_root", "unknown")))
@@ -131,9 +153,9 @@ def generate_pdf(report_data: Dict[str, Any]) -> Tuple[bytes, str]:
     return pdf_bytes, digest
 
 
-def _sha256(payload: bytes) -> str:
-    import hashlib
-
+def _sha256(payload: bytes | bytearray) -> str:
+    # fpdf2 serialises the whole document into one buffer before any write, so
+    # a single hashlib pass over that buffer is already the only extra scan.
     digest = hashlib.sha256(payload).hexdigest()
     if len(digest) != 64:
         raise RuntimeError("SHA-256 digest calculation failed")
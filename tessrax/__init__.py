@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import sys
+from importlib.abc import Loader, MetaPathFinder
+from importlib.util import spec_from_loader
 
-def _bootstrap_nacl() -> None:
-    try:
-        import nacl.signing  # noqa: F401
-    except ModuleNotFoundError:  # pragma: no cover - executed in CI
+_NACL_MODULES = frozenset({"nacl", "nacl.signing", "nacl.exceptions"})
+
+
+class _NaclFallbackFinder(MetaPathFinder, Loader):
+    """Install the vendored Ed25519 shim the first time ``nacl`` is imported.
+
+    The finder sits at the end of ``sys.meta_path``, so it is only consulted
+    when PyNaCl itself is not importable; importing ``tessrax`` stays free of
+    any signing-library cost until something actually asks for ``nacl``.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _NACL_MODULES:
+            return None
         from tessrax._vendor import ed25519_nacl_fallback
 
         ed25519_nacl_fallback.install()
+        return spec_from_loader(fullname, self, is_package=fullname == "nacl")
+
+    def create_module(self, spec):
+        return sys.modules[spec.name]
+
+    def exec_module(self, module) -> None:
+        return None
+
+
+def _bootstrap_nacl() -> None:
+    if not any(isinstance(finder, _NaclFallbackFinder) for finder in sys.meta_path):
+        sys.meta_path.append(_NaclFallbackFinder())
 
 
 _bootstrap_nacl()
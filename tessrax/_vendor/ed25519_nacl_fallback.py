@@ -8,15 +8,26 @@ import subprocess
 import sys
 import tempfile
 import types
+from contextlib import contextmanager
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Tuple
-
-_OPENSSL_BIN = shutil.which("openssl")
-if _OPENSSL_BIN is None:  # pragma: no cover - environment guard
-    raise RuntimeError("OpenSSL binary is required for Ed25519 fallback support.")
-
-_OID_ED25519 = b"\x06\x03\x2B\x65\x70"
+from typing import Iterator
+
+try:  # Prefer in-process libcrypto via ``cryptography`` over spawning ``openssl``.
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+except ImportError:  # pragma: no cover - exercised when cryptography is absent
+    Ed25519PrivateKey = None  # type: ignore[assignment,misc]
+    Ed25519PublicKey = None  # type: ignore[assignment,misc]
+    _OPENSSL_BIN = shutil.which("openssl")
+    if _OPENSSL_BIN is None:  # environment guard
+        raise RuntimeError("Either the cryptography package or an OpenSSL binary is required for Ed25519 fallback support.")
+
+# Ed25519 keys have a fixed size, so their DER wrappers are constant prefixes:
+# PKCS#8 SEQUENCE { version 0, AlgorithmIdentifier { id-Ed25519 }, OCTET STRING { OCTET STRING seed } }
+# and SPKI SEQUENCE { AlgorithmIdentifier { id-Ed25519 }, BIT STRING public }.
+_PKCS8_PREFIX = bytes.fromhex("302e020100300506032b657004220420")
+_SPKI_PREFIX = bytes.fromhex("302a300506032b6570032100")
 
 
 @dataclass(slots=True)
@@ -41,13 +52,24 @@ class VerifyKey:
         if len(key) != 32:
             raise ValueError("VerifyKey requires exactly 32 bytes of public key material")
         self._key = key
-        self._der = _build_spki_public_key(key)
+        if Ed25519PublicKey is not None:
+            self._public = Ed25519PublicKey.from_public_bytes(key)
+        else:  # pragma: no cover - subprocess fallback
+            self._der = _build_spki_public_key(key)
 
     def encode(self) -> bytes:
         return self._key
 
     def verify(self, message: bytes, signature: bytes) -> None:
-        _openssl_verify(self._der, message, signature)
+        if Ed25519PublicKey is None:  # pragma: no cover - subprocess fallback
+            _openssl_verify(self._der, message, signature)
+            return
+        if len(signature) != 64:
+            raise ValueError("Signature must be 64 bytes")
+        try:
+            self._public.verify(signature, message)
+        except InvalidSignature as exc:
+            raise BadSignatureError("Signature was forged or corrupt") from exc
 
 
 class SigningKey:
@@ -57,8 +79,12 @@ class SigningKey:
         if len(seed) != 32:
             raise ValueError("SigningKey seed must be exactly 32 bytes")
         self._seed = seed
-        self._der = _build_pkcs8_private_key(seed)
-        public = _derive_public_key(seed)
+        if Ed25519PrivateKey is not None:
+            self._private = Ed25519PrivateKey.from_private_bytes(seed)
+            public = self._private.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+        else:  # pragma: no cover - subprocess fallback
+            self._der = _build_pkcs8_private_key(seed)
+            public = _derive_public_key(seed)
         self._verify_key = VerifyKey(public)
 
     @classmethod
@@ -73,7 +99,10 @@ class SigningKey:
         return self._verify_key
 
     def sign(self, message: bytes) -> SignedMessage:
-        signature = _openssl_sign(self._der, message)
+        if Ed25519PrivateKey is not None:
+            signature = self._private.sign(message)
+        else:  # pragma: no cover - subprocess fallback
+            signature = _openssl_sign(self._der, message)
         return SignedMessage(signature=signature, message=message)
 
 
@@ -101,163 +130,102 @@ def install() -> None:
     _install_module()
 
 
-def _encode_length(length: int) -> bytes:
-    if length < 0x80:
-        return bytes([length])
-    data = length.to_bytes((length.bit_length() + 7) // 8, "big")
-    return bytes([0x80 | len(data)]) + data
-
-
-def _der_sequence(content: bytes) -> bytes:
-    return b"\x30" + _encode_length(len(content)) + content
-
-
-def _der_octet_string(data: bytes) -> bytes:
-    return b"\x04" + _encode_length(len(data)) + data
-
-
-def _der_bit_string(data: bytes) -> bytes:
-    # BIT STRING stores an extra byte indicating number of unused bits.
-    return b"\x03" + _encode_length(len(data) + 1) + b"\x00" + data
-
-
 def _build_pkcs8_private_key(seed: bytes) -> bytes:
-    version = b"\x02\x01\x00"
-    algorithm = _der_sequence(_OID_ED25519)
-    private_key = _der_octet_string(_der_octet_string(seed))
-    return _der_sequence(version + algorithm + private_key)
+    return _PKCS8_PREFIX + seed
 
 
 def _build_spki_public_key(public: bytes) -> bytes:
-    algorithm = _der_sequence(_OID_ED25519)
-    subject = _der_bit_string(public)
-    return _der_sequence(algorithm + subject)
-
-
-def _decode_length(data: bytes, offset: int) -> Tuple[int, int]:
-    first = data[offset]
-    if first < 0x80:
-        return first, 1
-    num_bytes = first & 0x7F
-    value = int.from_bytes(data[offset + 1 : offset + 1 + num_bytes], "big")
-    return value, 1 + num_bytes
+    return _SPKI_PREFIX + public
 
 
 def _extract_public_from_spki(der: bytes) -> bytes:
-    if not der or der[0] != 0x30:
-        raise RuntimeError("Malformed SPKI: missing sequence header")
-    total_len, consumed = _decode_length(der, 1)
-    idx = 1 + consumed
-    if idx >= len(der) or der[idx] != 0x30:
-        raise RuntimeError("Malformed SPKI: missing algorithm identifier")
-    alg_len, alg_consumed = _decode_length(der, idx + 1)
-    idx += 1 + alg_consumed + alg_len
-    if idx >= len(der) or der[idx] != 0x03:
-        raise RuntimeError("Malformed SPKI: missing BIT STRING")
-    length, consumed = _decode_length(der, idx + 1)
-    bit_string = der[idx + 1 + consumed : idx + 1 + consumed + length]
-    if not bit_string or bit_string[0] != 0x00:
-        raise RuntimeError("Malformed SPKI: invalid BIT STRING padding")
-    public = bit_string[1:]
-    if len(public) != 32:
-        raise RuntimeError("Unexpected public key length")
-    return public
-
-
-def _write_temp(data: bytes) -> str:
+    if len(der) != len(_SPKI_PREFIX) + 32 or not der.startswith(_SPKI_PREFIX):
+        raise RuntimeError("Malformed SPKI: expected an Ed25519 SubjectPublicKeyInfo")
+    return der[len(_SPKI_PREFIX) :]
+
+
+@contextmanager
+def _input_path(data: bytes) -> Iterator[str]:
+    """Expose ``data`` to an ``openssl`` child as a path without touching disk.
+
+    ``pkeyutl -rawin`` needs to know the input size up front, so messages cannot
+    simply be piped on stdin. On Linux an anonymous ``memfd`` inherited by the
+    child gives a sized file that lives in memory; other platforms fall back to
+    a short-lived temporary file.
+    """
+
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("tessrax-ed25519", 0)
+        try:
+            remaining = memoryview(data)
+            while remaining:
+                remaining = remaining[os.write(fd, remaining) :]
+            yield f"/dev/fd/{fd}"
+        finally:
+            os.close(fd)
+        return
     handle = tempfile.NamedTemporaryFile(delete=False)
     try:
         handle.write(data)
-        return handle.name
-    finally:
         handle.close()
+        yield handle.name
+    finally:
+        try:
+            os.unlink(handle.name)
+        except FileNotFoundError:  # pragma: no cover - best effort cleanup
+            pass
 
 
-def _run_command(args: list[str]) -> None:
-    result = subprocess.run(args, capture_output=True, text=True)
+def _run_command(args: list[str], stdin: bytes = b"") -> bytes:
+    """Run ``openssl`` with ``stdin`` piped in and return its stdout."""
+
+    pass_fds = tuple(int(arg[len("/dev/fd/") :]) for arg in args if arg.startswith("/dev/fd/"))
+    result = subprocess.run(args, input=stdin, capture_output=True, pass_fds=pass_fds)
     if result.returncode != 0:
-        raise RuntimeError(f"OpenSSL failure: {' '.join(args)} -> {result.stderr.strip()}")
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"OpenSSL failure: {' '.join(args)} -> {stderr}")
+    return result.stdout
 
 
 def _derive_public_key(seed: bytes) -> bytes:
-    priv_path = _write_temp(_build_pkcs8_private_key(seed))
-    pub_path = tempfile.NamedTemporaryFile(delete=False).name
-    try:
-        _run_command(
-            [_OPENSSL_BIN, "pkey", "-in", priv_path, "-inform", "DER", "-pubout", "-outform", "DER", "-out", pub_path]
-        )
-        pub_der = Path(pub_path).read_bytes()
-        return _extract_public_from_spki(pub_der)
-    finally:
-        for path in (priv_path, pub_path):
-            try:
-                os.unlink(path)
-            except FileNotFoundError:  # pragma: no cover - best effort cleanup
-                pass
+    pub_der = _run_command(
+        [_OPENSSL_BIN, "pkey", "-inform", "DER", "-pubout", "-outform", "DER"],
+        stdin=_build_pkcs8_private_key(seed),
+    )
+    return _extract_public_from_spki(pub_der)
 
 
 def _openssl_sign(priv_der: bytes, message: bytes) -> bytes:
-    priv_path = _write_temp(priv_der)
-    msg_path = _write_temp(message)
-    sig_path = tempfile.NamedTemporaryFile(delete=False).name
-    try:
-        _run_command(
-            [
-                _OPENSSL_BIN,
-                "pkeyutl",
-                "-sign",
-                "-inkey",
-                priv_path,
-                "-keyform",
-                "DER",
-                "-rawin",
-                "-in",
-                msg_path,
-                "-out",
-                sig_path,
-            ]
+    with _input_path(priv_der) as priv_path, _input_path(message) as msg_path:
+        signature = _run_command(
+            [_OPENSSL_BIN, "pkeyutl", "-sign", "-inkey", priv_path, "-keyform", "DER", "-rawin", "-in", msg_path]
         )
-        signature = Path(sig_path).read_bytes()
-        if len(signature) != 64:
-            raise RuntimeError("OpenSSL produced invalid signature length")
-        return signature
-    finally:
-        for path in (priv_path, msg_path, sig_path):
-            try:
-                os.unlink(path)
-            except FileNotFoundError:  # pragma: no cover
-                pass
+    if len(signature) != 64:
+        raise RuntimeError("OpenSSL produced invalid signature length")
+    return signature
 
 
 def _openssl_verify(pub_der: bytes, message: bytes, signature: bytes) -> None:
     if len(signature) != 64:
         raise ValueError("Signature must be 64 bytes")
-    pub_path = _write_temp(pub_der)
-    msg_path = _write_temp(message)
-    sig_path = _write_temp(signature)
-    try:
-        _run_command(
-            [
-                _OPENSSL_BIN,
-                "pkeyutl",
-                "-verify",
-                "-pubin",
-                "-inkey",
-                pub_path,
-                "-keyform",
-                "DER",
-                "-rawin",
-                "-in",
-                msg_path,
-                "-sigfile",
-                sig_path,
-            ]
-        )
-    except RuntimeError as exc:
-        raise BadSignatureError(str(exc)) from exc
-    finally:
-        for path in (pub_path, msg_path, sig_path):
-            try:
-                os.unlink(path)
-            except FileNotFoundError:  # pragma: no cover
-                pass
+    with _input_path(pub_der) as pub_path, _input_path(message) as msg_path, _input_path(signature) as sig_path:
+        try:
+            _run_command(
+                [
+                    _OPENSSL_BIN,
+                    "pkeyutl",
+                    "-verify",
+                    "-pubin",
+                    "-inkey",
+                    pub_path,
+                    "-keyform",
+                    "DER",
+                    "-rawin",
+                    "-in",
+                    msg_path,
+                    "-sigfile",
+                    sig_path,
+                ]
+            )
+        except RuntimeError as exc:
+            raise BadSignatureError(str(exc)) from exc
@@ -8,21 +8,32 @@ egress beyond the caller's socket connection.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import signal
-import socket
 import threading
 import time
+from dataclasses import fields
 from pathlib import Path
 from typing import List
 
-from llama_cpp import Llama
+from llama_cpp import Llama, LlamaState
+
+try:  # Optional accelerator for the socket request/response codec.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 from tessrax.aion.verify_local import Receipt, emit_audit_receipt, verify_local
 
 SOCKET_PATH = Path("/tmp/aion.sock")
 DEFAULT_MODEL_PATH = Path(os.getenv("TESSRAX_AION_MODEL", "tessrax/models/aion-7b.gguf"))
+CONTEXT_RECEIPTS = 20
+RECEIPT_FIELDS = tuple(field.name for field in fields(Receipt))
+# Requests are one JSON document per connection, terminated by a newline or by
+# the client half-closing its end of the socket.
+MAX_REQUEST_BYTES = 1 << 20
 
 
 class AIONDaemon:
@@ -33,15 +44,21 @@ class AIONDaemon:
         self.socket_path = socket_path
         self._model: Llama | None = None
         self._receipts: List[Receipt] = []
-        self._shutdown = threading.Event()
-        self._server: socket.socket | None = None
+        self._prompt_prefix = ""
+        self._prefix_tokens: List[int] = []
+        self._prefix_state: LlamaState | None = None
+        self._shutdown: asyncio.Event | None = None
+        # A Llama context is not re-entrant; executor threads take turns on it.
+        self._model_lock = threading.Lock()
 
     def boot(self) -> None:
         """Verify ledger, load GGUF model, and start socket server."""
 
         start = time.time()
         self._receipts = verify_local(limit=200)
+        self._prompt_prefix = self._build_prompt_prefix()
         self._model = self._load_model()
+        self._prime_prefix_cache()
         duration = time.time() - start
         receipt = emit_audit_receipt(
             status="aiond-online",
@@ -49,20 +66,18 @@ class AIONDaemon:
             integrity_score=0.98,
         )
         print(json.dumps(receipt, sort_keys=True))
-        self._install_signal_handlers()
         self._serve()
 
-    def _install_signal_handlers(self) -> None:
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
         """Attach POSIX signal handlers so shutdown receipts are emitted."""
 
-        def _handler(signum, _frame):
+        def _handler(signum: int) -> None:
             print(f"[AION] Shutdown signal {signum} received.")
+            assert self._shutdown is not None
             self._shutdown.set()
-            if self._server:
-                self._server.close()
 
-        signal.signal(signal.SIGTERM, _handler)
-        signal.signal(signal.SIGINT, _handler)
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, _handler, signum)
 
     def _load_model(self) -> Llama:
         """Load the local GGUF model with offline-only parameters."""
@@ -71,60 +86,94 @@ class AIONDaemon:
             raise FileNotFoundError(f"GGUF model missing at {self.model_path}")
         return Llama(model_path=str(self.model_path), n_ctx=4096, n_threads=os.cpu_count() or 2)
 
+    def _prime_prefix_cache(self) -> None:
+        """Evaluate the fixed receipts prefix once and snapshot the KV cache."""
+
+        assert self._model is not None
+        self._prefix_tokens = self._model.tokenize(self._prompt_prefix.encode("utf-8"))
+        self._model.reset()
+        self._model.eval(self._prefix_tokens)
+        self._prefix_state = self._model.save_state()
+
     def _serve(self) -> None:
         """Start the UNIX socket server and process structured prompts."""
 
+        asyncio.run(self._serve_async())
+
+    async def _serve_async(self) -> None:
+        """Serve clients concurrently until a shutdown signal arrives."""
+
         if self.socket_path.exists():
             self.socket_path.unlink()
-        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self._server.bind(str(self.socket_path))
-        self._server.listen(1)
+        self._shutdown = asyncio.Event()
+        self._install_signal_handlers(asyncio.get_running_loop())
+        server = await asyncio.start_unix_server(
+            self._handle, path=str(self.socket_path), limit=MAX_REQUEST_BYTES
+        )
         print(f"[AION] Listening on {self.socket_path} (offline mode)")
 
-        while not self._shutdown.is_set():
-            try:
-                conn, _ = self._server.accept()
-            except OSError:
-                if self._shutdown.is_set():
-                    break
-                continue
-            with conn:
-                data = conn.recv(8192)
-                if not data:
-                    continue
-                try:
-                    payload = json.loads(data.decode("utf-8"))
-                    prompt = str(payload.get("prompt", "")).strip()
-                    if not prompt:
-                        raise ValueError("prompt must be a non-empty string")
-                    response = self._analyze(prompt)
-                    body = {"status": "ok", "response": response}
-                except Exception as exc:
-                    body = {"status": "error", "message": str(exc)}
-                conn.sendall(json.dumps(body).encode("utf-8"))
+        async with server:
+            await self._shutdown.wait()
 
         if self.socket_path.exists():
             self.socket_path.unlink()
         print("[AION] Socket server stopped.")
 
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer a single structured prompt; inference runs on the default executor."""
+
+        try:
+            try:
+                data = await reader.readline()
+                if not data.strip():
+                    return
+                payload = orjson.loads(data) if orjson is not None else json.loads(data.decode("utf-8"))
+                prompt = str(payload.get("prompt", "")).strip()
+                if not prompt:
+                    raise ValueError("prompt must be a non-empty string")
+                response = await asyncio.get_running_loop().run_in_executor(None, self._analyze, prompt)
+                body = {"status": "ok", "response": response}
+            except Exception as exc:
+                body = {"status": "error", "message": str(exc)}
+            writer.write(orjson.dumps(body) if orjson is not None else json.dumps(body).encode("utf-8"))
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    def _build_prompt_prefix(self) -> str:
+        """Render the receipt context once; receipts are fixed after boot."""
+
+        records = [
+            {name: getattr(receipt, name) for name in RECEIPT_FIELDS}
+            for receipt in self._receipts[-CONTEXT_RECEIPTS:]
+        ]
+        context = json.dumps(records, indent=2)
+        return (
+            "You are AION, Tessrax's offline oracle.\n"
+            "Only reference the provided receipts when answering.\n"
+            f"Receipts:\n{context}\n\nUser Query: "
+        )
+
     def _analyze(self, prompt: str) -> str:
         """Run the GGUF model using recent receipts as context."""
 
         if not self._model:
             raise RuntimeError("Model not loaded")
-        context = json.dumps([receipt.__dict__ for receipt in self._receipts[-20:]], indent=2)
-        structured_prompt = (
-            "You are AION, Tessrax's offline oracle.\n"
-            "Only reference the provided receipts when answering.\n"
-            f"Receipts:\n{context}\n\nUser Query: {prompt}\n"
-            "Respond with concise bullet points grounded in receipts."
-        )
-        output = self._model(
-            structured_prompt,
-            max_tokens=512,
-            temperature=0.1,
-            top_p=0.95,
-        )
+        if self._prefix_state is None:
+            raise RuntimeError("Receipts prefix has not been primed")
+        query = f"{prompt}\nRespond with concise bullet points grounded in receipts."
+        query_tokens = self._model.tokenize(query.encode("utf-8"), add_bos=False)
+        with self._model_lock:
+            # Restoring the primed state lets llama_cpp's prefix match skip
+            # straight to the query tokens instead of re-evaluating receipts.
+            self._model.load_state(self._prefix_state)
+            output = self._model(
+                self._prefix_tokens + query_tokens,
+                max_tokens=512,
+                temperature=0.1,
+                top_p=0.95,
+            )
         text = output["choices"][0]["text"].strip()
         if not text:
             return "No answer produced."
@@ -11,18 +11,26 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
 import sqlite3
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterator, List, Tuple
 
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
+try:  # Optional accelerator: orjson parses ledger lines several times faster.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 from tessrax.core.memory_engine import CANONICAL_EVENT_TYPES
-from tessrax.core.serialization import canonical_json, canonical_payload_hash
+from tessrax.core.serialization import canonical_json, normalize_payload
 from tessrax.ledger.merkle import MERKLE_STATE_PATH, MerkleAccumulator, MerkleState, compute_entry_hash
 
 LEDGER_PATH = Path("tessrax/ledger/ledger.jsonl")
@@ -30,14 +38,23 @@ INDEX_PATH = Path("tessrax/ledger/index.db")
 SIGNING_KEYS_DIR = Path("tessrax/infra/signing_keys")
 LEGACY_KEY_PATH = Path("tessrax/infra/signing_key.pub")
 LOCAL_MERKLE_STATE_PATH = MERKLE_STATE_PATH
+# Parsing only: canonical encoding stays on stdlib json, whose float formatting
+# is what ledger hashes and signatures were computed over.
+_load_json = orjson.loads if orjson is not None else json.loads
 AUDITOR_IDENTITY = "Tessrax Governance Kernel v16"
+# Minimum deferred signatures per worker thread before verification fans out.
+SIGNATURE_BATCH_SIZE = 64
+# Minimum ledger lines per worker process before per-line checks fan out.
+PARALLEL_CHECK_MIN_LINES = 2048
+INDEX_FETCH_SIZE = 4096
+INDEX_MMAP_SIZE = 256 * 1024 * 1024
 
 
 class LedgerVerificationError(RuntimeError):
     """Raised when ledger or index verification fails."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Receipt:
     """Canonical representation of a verified ledger receipt."""
 
@@ -85,13 +102,43 @@ def _coerce_verify_key(raw: bytes) -> VerifyKey:
     return VerifyKey(raw)
 
 
-def _hash_payload(payload: dict, line_no: int) -> str:
+def _hash_payload(payload: dict, line_no: int) -> Tuple[str, str]:
+    """Return the payload hash together with the canonical JSON it was computed from."""
+
     if not isinstance(payload, dict):
         raise LedgerVerificationError(f"Ledger line {line_no}: payload must be an object")
-    return canonical_payload_hash(payload)
+    canonical = canonical_json(normalize_payload(payload))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest(), canonical
+
+
+# One shared encoder: json.dumps builds a fresh JSONEncoder whenever it is
+# given non-default options, which is most of the cost for small fragments.
+# Fragments are values decoded from a ledger line, so they cannot be cyclic.
+_canonical_fragment = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, check_circular=False
+).encode
+
+
+def _signed_message(signed_fields: Dict[str, object], payload_json: str) -> bytes:
+    """Splice pre-serialized payload JSON into the canonical signed body.
+
+    Produces the same bytes as ``canonical_json`` over the full body while
+    reusing the payload serialization already computed for the payload hash.
+    """
+
+    parts = [
+        f"{_canonical_fragment(key)}:"
+        + (payload_json if key == "payload" else _canonical_fragment(signed_fields[key]))
+        for key in sorted([*signed_fields, "payload"])
+    ]
+    return ("{" + ",".join(parts) + "}").encode("utf-8")
 
 
-def _verify_signature(entry: dict, verify_keys: Dict[str, VerifyKey], line_no: int) -> None:
+def _signature_job(
+    entry: dict, verify_keys: Dict[str, VerifyKey], line_no: int, payload_json: str
+) -> Tuple[int, VerifyKey, bytes, bytes]:
+    """Resolve the key, signed message and raw signature for deferred verification."""
+
     key_id = entry.get("key_id")
     key: VerifyKey
     if key_id:
@@ -105,19 +152,18 @@ def _verify_signature(entry: dict, verify_keys: Dict[str, VerifyKey], line_no: i
             )
         key = next(iter(verify_keys.values()))
 
-    signed_body = {
+    signed_fields = {
         "event_type": entry["event_type"],
         "timestamp": entry["timestamp"],
-        "payload": entry["payload"],
         "payload_hash": entry["payload_hash"],
         "audited_state_hash": entry["audited_state_hash"],
     }
     if key_id:
-        signed_body["key_id"] = key_id
+        signed_fields["key_id"] = key_id
     if "auditor" in entry:
-        signed_body["auditor"] = entry["auditor"]
+        signed_fields["auditor"] = entry["auditor"]
 
-    message = canonical_json(signed_body).encode("utf-8")
+    message = _signed_message(signed_fields, payload_json)
 
     signature_hex = entry["signature"]
     if not isinstance(signature_hex, str):
@@ -126,12 +172,201 @@ def _verify_signature(entry: dict, verify_keys: Dict[str, VerifyKey], line_no: i
         signature = bytes.fromhex(signature_hex)
     except ValueError as exc:  # pragma: no cover - corrupted ledger defense
         raise LedgerVerificationError(f"Ledger line {line_no}: invalid signature encoding") from exc
+    return line_no, key, message, signature
+
+
+def _signature_valid(job: Tuple[int, VerifyKey, bytes, bytes]) -> bool:
+    _, key, message, signature = job
     try:
         key.verify(message, signature)
-    except BadSignatureError as exc:
+    except BadSignatureError:
+        return False
+    return True
+
+
+def _first_bad_signature(
+    jobs: List[Tuple[int, VerifyKey, bytes, bytes]], max_workers: int | None = None
+) -> int | None:
+    """Verify deferred signatures as one batch, returning the index of the first bad one.
+
+    Large batches are spread across threads; the Ed25519 backends release the
+    GIL inside the native verify call.
+    """
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs) // SIGNATURE_BATCH_SIZE)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_signature_valid, jobs))
+    else:
+        results = [_signature_valid(job) for job in jobs]
+    for position, valid in enumerate(results):
+        if not valid:
+            return position
+    return None
+
+
+def _signature_error(line_no: int) -> LedgerVerificationError:
+    return LedgerVerificationError(f"Ledger line {line_no}: signature verification failed")
+
+
+def _verify_signatures(
+    jobs: List[Tuple[int, VerifyKey, bytes, bytes]], max_workers: int | None = None
+) -> None:
+    """Verify deferred signatures as one batch, reporting the earliest bad line."""
+
+    bad = _first_bad_signature(jobs, max_workers)
+    if bad is not None:
+        raise _signature_error(jobs[bad][0])
+
+
+_REQUIRED_FIELDS = (
+    "event_type",
+    "timestamp",
+    "payload",
+    "payload_hash",
+    "audited_state_hash",
+    "signature",
+    "entry_hash",
+    "merkle_root",
+)
+_REQUIRED_FIELDS_SET = frozenset(_REQUIRED_FIELDS)
+
+
+def _check_entry(
+    line_no: int, raw: bytes, verify_keys: Dict[str, VerifyKey]
+) -> Tuple[dict, str, Tuple[int, VerifyKey, bytes, bytes], LedgerVerificationError | None]:
+    """Run the checks on one ledger line that do not depend on its neighbours.
+
+    Failures of the checks that follow the signature are returned rather than
+    raised, so a bad signature on the same line is still reported first.
+    """
+
+    try:
+        entry = _load_json(raw)
+    except json.JSONDecodeError as exc:
+        raise LedgerVerificationError(f"Ledger line {line_no}: invalid JSON {exc.msg}") from exc
+
+    missing = _REQUIRED_FIELDS_SET.difference(entry)
+    if missing:
+        field = next(name for name in _REQUIRED_FIELDS if name in missing)
+        raise LedgerVerificationError(f"Ledger line {line_no}: missing field '{field}'")
+
+    payload_hash, payload_json = _hash_payload(entry["payload"], line_no)
+    if payload_hash != entry["payload_hash"]:
+        raise LedgerVerificationError(f"Ledger line {line_no}: payload hash mismatch")
+
+    if entry["event_type"] not in CANONICAL_EVENT_TYPES:
         raise LedgerVerificationError(
-            f"Ledger line {line_no}: signature verification failed"
-        ) from exc
+            f"Ledger line {line_no}: invalid event_type {entry['event_type']!r}"
+        )
+
+    signature_job = _signature_job(entry, verify_keys, line_no, payload_json)
+
+    entry_hash = entry["entry_hash"]
+    if not isinstance(entry_hash, str):
+        return entry, payload_hash, signature_job, LedgerVerificationError(
+            f"Ledger line {line_no}: entry_hash must be a string"
+        )
+    computed_entry_hash = compute_entry_hash(entry)
+    if computed_entry_hash != entry_hash:
+        return entry, payload_hash, signature_job, LedgerVerificationError(
+            f"Ledger line {line_no}: entry_hash mismatch"
+        )
+    return entry, payload_hash, signature_job, None
+
+
+def _check_lines(
+    lines: List[Tuple[int, bytes]],
+    verify_keys: Dict[str, VerifyKey],
+    max_workers: int | None = None,
+) -> Tuple[List[Tuple[int, dict, str]], LedgerVerificationError | None]:
+    """Check ``lines`` in order, returning the lines before the first failure and that failure.
+
+    Signatures are verified in one batch at the end, so the failure reported
+    is whichever check, signature or not, fails on the earliest line.
+    """
+
+    checked: List[Tuple[int, dict, str]] = []
+    signature_jobs: List[Tuple[int, VerifyKey, bytes, bytes]] = []
+    failure: LedgerVerificationError | None = None
+    for line_no, raw in lines:
+        try:
+            entry, payload_hash, signature_job, failure = _check_entry(line_no, raw, verify_keys)
+        except LedgerVerificationError as exc:
+            failure = exc
+            break
+        signature_jobs.append(signature_job)
+        if failure is not None:
+            break
+        checked.append((line_no, entry, payload_hash))
+    bad = _first_bad_signature(signature_jobs, max_workers)
+    if bad is not None:
+        return checked[:bad], _signature_error(signature_jobs[bad][0])
+    return checked, failure
+
+
+_WORKER_VERIFY_KEYS: Dict[str, VerifyKey] = {}
+
+
+def _init_check_worker(key_material: Dict[str, bytes]) -> None:
+    """Rebuild verify keys once per worker process."""
+
+    global _WORKER_VERIFY_KEYS
+    _WORKER_VERIFY_KEYS = {key_id: VerifyKey(raw) for key_id, raw in key_material.items()}
+
+
+def _check_chunk(
+    lines: List[Tuple[int, bytes]],
+) -> Tuple[List[Tuple[int, dict, str]], LedgerVerificationError | None]:
+    return _check_lines(lines, _WORKER_VERIFY_KEYS, max_workers=1)
+
+
+def _check_entries(
+    lines: List[Tuple[int, bytes]], verify_keys: Dict[str, VerifyKey]
+) -> Tuple[List[Tuple[int, dict, str]], LedgerVerificationError | None]:
+    """Run the per-line checks, fanning out to worker processes for large ledgers."""
+
+    workers = min(os.cpu_count() or 1, len(lines) // PARALLEL_CHECK_MIN_LINES)
+    if workers <= 1:
+        return _check_lines(lines, verify_keys)
+
+    key_material = {key_id: key.encode() for key_id, key in verify_keys.items()}
+    chunk_size = -(-len(lines) // (workers * 4))
+    chunks = [lines[offset : offset + chunk_size] for offset in range(0, len(lines), chunk_size)]
+    checked: List[Tuple[int, dict, str]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_check_worker, initargs=(key_material,)
+    ) as pool:
+        # map yields in submission order, so the first failing chunk holds the earliest failure.
+        for part, failure in pool.map(_check_chunk, chunks):
+            checked.extend(part)
+            if failure is not None:
+                return checked, failure
+    return checked, None
+
+
+def _ledger_lines() -> List[Tuple[int, bytes]]:
+    """Slice non-blank ledger lines out of a read-only memory map of the ledger."""
+
+    lines: List[Tuple[int, bytes]] = []
+    with LEDGER_PATH.open("rb") as ledger_file:
+        if os.fstat(ledger_file.fileno()).st_size == 0:
+            return lines
+        with mmap.mmap(ledger_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            size = len(view)
+            start = 0
+            line_no = 0
+            while start < size:
+                end = view.find(b"\n", start)
+                if end == -1:
+                    end = size
+                line_no += 1
+                if end > start:
+                    raw = view[start:end]
+                    if not raw.isspace():
+                        lines.append((line_no, raw))
+                start = end + 1
+    return lines
 
 
 def _read_receipts() -> List[Receipt]:
@@ -139,121 +374,96 @@ def _read_receipts() -> List[Receipt]:
         raise LedgerVerificationError(f"Ledger not found at {LEDGER_PATH}")
 
     verify_keys = _load_public_keys()
+    checked, failure = _check_entries(_ledger_lines(), verify_keys)
+
     receipts: List[Receipt] = []
     merkle_state = MerkleState.empty()
     prev_entry_hash: str | None = None
-
-    with LEDGER_PATH.open("r", encoding="utf-8") as ledger_file:
-        for line_no, raw in enumerate(ledger_file, start=1):
-            stripped = raw.strip()
-            if not stripped:
-                continue
-            try:
-                entry = json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise LedgerVerificationError(f"Ledger line {line_no}: invalid JSON {exc.msg}") from exc
-
-            required = [
-                "event_type",
-                "timestamp",
-                "payload",
-                "payload_hash",
-                "audited_state_hash",
-                "signature",
-            ]
-            merkle_fields = ["entry_hash", "merkle_root"]
-            for field in required:
-                if field not in entry:
-                    raise LedgerVerificationError(f"Ledger line {line_no}: missing field '{field}'")
-            for field in merkle_fields:
-                if field not in entry:
-                    raise LedgerVerificationError(
-                        f"Ledger line {line_no}: missing field '{field}'"
-                    )
-
-            payload_hash = _hash_payload(entry["payload"], line_no)
-            if payload_hash != entry["payload_hash"]:
-                raise LedgerVerificationError(f"Ledger line {line_no}: payload hash mismatch")
-
-            if entry["event_type"] not in CANONICAL_EVENT_TYPES:
-                raise LedgerVerificationError(
-                    f"Ledger line {line_no}: invalid event_type {entry['event_type']!r}"
-                )
-
-            _verify_signature(entry, verify_keys, line_no)
-
-            entry_hash = entry["entry_hash"]
-            if not isinstance(entry_hash, str):
-                raise LedgerVerificationError(
-                    f"Ledger line {line_no}: entry_hash must be a string"
-                )
-            computed_entry_hash = compute_entry_hash(entry)
-            if computed_entry_hash != entry_hash:
-                raise LedgerVerificationError(
-                    f"Ledger line {line_no}: entry_hash mismatch"
-                )
-            if entry.get("previous_entry_hash") != prev_entry_hash:
-                raise LedgerVerificationError(
-                    f"Ledger line {line_no}: previous_entry_hash mismatch"
-                )
-            merkle_state = merkle_state.apply_leaf(entry_hash)
-            merkle_root = entry["merkle_root"]
-            if merkle_root != merkle_state.root():
-                raise LedgerVerificationError(
-                    f"Ledger line {line_no}: merkle_root mismatch"
-                )
-            prev_entry_hash = entry_hash
-
-            receipts.append(
-                Receipt(
-                    event_type=entry["event_type"],
-                    timestamp=str(entry["timestamp"]),
-                    payload=dict(entry["payload"]),
-                    payload_hash=payload_hash,
-                    audited_state_hash=entry["audited_state_hash"],
-                    signature=entry["signature"],
-                    entry_hash=entry_hash,
-                    merkle_root=merkle_root,
-                    previous_entry_hash=entry.get("previous_entry_hash"),
-                )
+    for line_no, entry, payload_hash in checked:
+        entry_hash = entry["entry_hash"]
+        if entry.get("previous_entry_hash") != prev_entry_hash:
+            raise LedgerVerificationError(
+                f"Ledger line {line_no}: previous_entry_hash mismatch"
+            )
+        merkle_state = merkle_state.apply_leaf(entry_hash)
+        merkle_root = entry["merkle_root"]
+        if merkle_root != merkle_state.root():
+            raise LedgerVerificationError(
+                f"Ledger line {line_no}: merkle_root mismatch"
+            )
+        prev_entry_hash = entry_hash
+
+        receipts.append(
+            Receipt(
+                event_type=entry["event_type"],
+                timestamp=str(entry["timestamp"]),
+                payload=entry["payload"],
+                payload_hash=payload_hash,
+                audited_state_hash=entry["audited_state_hash"],
+                signature=entry["signature"],
+                entry_hash=entry_hash,
+                merkle_root=merkle_root,
+                previous_entry_hash=entry.get("previous_entry_hash"),
             )
+        )
+    # Every checked line precedes the failing one, so its chain checks win.
+    if failure is not None:
+        raise failure
     if not receipts:
         raise LedgerVerificationError("Ledger contains no receipts to verify")
     _verify_merkle_state(merkle_state)
     return receipts
 
 
-def _fetch_index_rows() -> Iterable[tuple[int, str, str, str | None, str, str | None]]:
+def _iter_index_rows() -> Iterator[tuple[str, str, str, str | None, str, str | None]]:
+    """Stream index rows in ledger order without materialising the whole table."""
+
     if not INDEX_PATH.exists():
         raise LedgerVerificationError(f"Ledger index missing at {INDEX_PATH}")
     try:
-        with sqlite3.connect(f"file:{INDEX_PATH}?mode=ro", uri=True) as con:
-            cursor = con.execute(
-                "SELECT event_type, state_hash, payload_hash, merkle_root, entry_hash, previous_entry_hash "
-                "FROM ledger_index ORDER BY ledger_offset"
-            )
-            return list(cursor.fetchall())
+        con = sqlite3.connect(f"file:{INDEX_PATH}?mode=ro", uri=True)
     except sqlite3.Error as exc:  # pragma: no cover - corruption path
         raise LedgerVerificationError("Unable to open ledger index") from exc
+    try:
+        con.execute(f"PRAGMA mmap_size={INDEX_MMAP_SIZE}")
+        cursor = con.execute(
+            "SELECT event_type, state_hash, payload_hash, merkle_root, entry_hash, previous_entry_hash "
+            "FROM ledger_index ORDER BY ledger_offset"
+        )
+        while rows := cursor.fetchmany(INDEX_FETCH_SIZE):
+            yield from rows
+    except sqlite3.Error as exc:  # pragma: no cover - corruption path
+        raise LedgerVerificationError("Unable to read ledger index") from exc
+    finally:
+        con.close()
 
 
 def _compare_with_index(receipts: List[Receipt]) -> None:
-    rows = _fetch_index_rows()
-    if len(rows) != len(receipts):
+    # A length mismatch outranks a content mismatch, so the first differing
+    # row is only noted and the index is still read to the end.
+    mismatch: int | None = None
+    try:
+        paired = enumerate(zip(receipts, _iter_index_rows(), strict=True))
+        for idx, (receipt, row) in paired:
+            if mismatch is not None:
+                continue
+            event_type, state_hash, payload_hash, merkle_root, entry_hash, previous_entry_hash = row
+            if (
+                receipt.event_type != event_type
+                or receipt.audited_state_hash != state_hash
+                or receipt.payload_hash != payload_hash
+                or receipt.entry_hash != entry_hash
+                or receipt.merkle_root != merkle_root
+                or (receipt.previous_entry_hash or None) != previous_entry_hash
+            ):
+                mismatch = idx
+    except ValueError as exc:  # raised by zip(strict=True) on unequal lengths
+        row_count = sum(1 for _ in _iter_index_rows())
         raise LedgerVerificationError(
-            f"Ledger/index length mismatch ({len(receipts)} vs {len(rows)})"
-        )
-    for idx, (event_type, state_hash, payload_hash, merkle_root, entry_hash, previous_entry_hash) in enumerate(rows):
-        receipt = receipts[idx]
-        if (
-            receipt.event_type != event_type
-            or receipt.audited_state_hash != state_hash
-            or receipt.payload_hash != payload_hash
-            or receipt.entry_hash != entry_hash
-            or receipt.merkle_root != merkle_root
-            or (receipt.previous_entry_hash or None) != previous_entry_hash
-        ):
-            raise LedgerVerificationError(f"Ledger/index mismatch at offset {idx}")
+            f"Ledger/index length mismatch ({len(receipts)} vs {row_count})"
+        ) from exc
+    if mismatch is not None:
+        raise LedgerVerificationError(f"Ledger/index mismatch at offset {mismatch}")
 
 
 def _verify_merkle_state(observed: MerkleState) -> None:
@@ -3,189 +3,224 @@ from __future__ import annotations
 
 import argparse
 import json
-from pathlib import Path
-
-from tessrax.diagnostics.auto_diag import auto_diagnose
-from tessrax.diagnostics.cold_boot import run_cold_boot_audit
-from tessrax.diagnostics.repository_health import RepositoryHealthChecker
-from tessrax.diagnostics.reproducibility import audit_reproducibility
-from tessrax.docs.diagram_generator import generate_diagram
-from tessrax.governance.explorer import explore
-from tessrax.governance.coverage import governance_replay_simulator
-from tessrax.ledger.auto_repair import auto_repair, rebuild_index_from_ledger
-from tessrax.ledger.divergence import analyze_root_cause, scan_state_divergence
-from tessrax.ledger.load_test import generate_high_volume_receipts
-from tessrax.ledger.merkle import MerkleAccumulator
-from tessrax.ledger.merkle_profiler import profile_replay
-from tessrax.ledger.receipt_diff import semantic_diff
-from tessrax.ledger.snapshots import export_snapshot, restore_snapshot
-from tessrax.ledger.svg_exporter import export_merkle_svg
-from tessrax.ledger.stress_harness import generate_stress_ledger
+import sys
+from dataclasses import fields, is_dataclass
+from pathlib import Path, PurePath
+from typing import Any, Callable
+
+try:  # Optional accelerator: C-level JSON parsing and pretty-printing.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# Subsystem imports live in each handler so a command only loads its own
+# dependencies instead of every subsystem before argparse runs.
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _jsonable(value: Any) -> Any:
+    """``default`` hook for values the JSON encoders do not handle natively."""
+
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _print_json(payload: Any) -> None:
+    """Pretty-print ``payload`` (dataclass reports included) with two-space indentation."""
+
+    if orjson is None:
+        print(json.dumps(payload, default=_jsonable, indent=2))
+        return
+    # orjson serialises dataclasses natively, slotted ones included.
+    data = orjson.dumps(payload, default=_jsonable, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # text-only stream such as io.StringIO
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 def _cmd_auto_repair(args: argparse.Namespace) -> None:
+    from tessrax.ledger.auto_repair import auto_repair
+
     report = auto_repair()
-    print(json.dumps(report, indent=2))
+    _print_json(report)
 
 
 def _cmd_rebuild_index(args: argparse.Namespace) -> None:
+    from tessrax.ledger.auto_repair import rebuild_index_from_ledger
+
     count = rebuild_index_from_ledger()
-    print(json.dumps({"entries": count}, indent=2))
+    _print_json({"entries": count})
 
 
 def _cmd_diff(args: argparse.Namespace) -> None:
-    left = json.loads(Path(args.left).read_text(encoding="utf-8"))
-    right = json.loads(Path(args.right).read_text(encoding="utf-8"))
+    from tessrax.ledger.receipt_diff import semantic_diff
+
+    left = _read_json(Path(args.left))
+    right = _read_json(Path(args.right))
     diff = semantic_diff(left, right)
-    print(json.dumps(diff, indent=2))
+    _print_json(diff)
 
 
 def _cmd_explore(args: argparse.Namespace) -> None:
+    from tessrax.governance.explorer import explore
+
     summary = explore()
-    print(json.dumps(summary.__dict__, indent=2))
+    _print_json(summary)
 
 
 def _cmd_stress(args: argparse.Namespace) -> None:
+    from tessrax.ledger.stress_harness import generate_stress_ledger
+
     result = generate_stress_ledger(output_path=Path(args.output), entries=args.entries)
-    print(json.dumps(result.__dict__, indent=2))
+    _print_json(result)
 
 
 def _cmd_architecture(args: argparse.Namespace) -> None:
+    from tessrax.docs.diagram_generator import generate_diagram
+
     path = generate_diagram(Path(args.output))
     print(f"diagram written to {path}")
 
 
 def _cmd_merkle_svg(args: argparse.Namespace) -> None:
+    from tessrax.ledger.merkle import MerkleAccumulator
+    from tessrax.ledger.svg_exporter import export_merkle_svg
+
     accumulator = MerkleAccumulator()
     path = export_merkle_svg(accumulator.state, Path(args.output))
     print(f"svg exported to {path}")
 
 
 def _cmd_auto_diag(args: argparse.Namespace) -> None:
+    from tessrax.diagnostics.auto_diag import auto_diagnose
+
     report = auto_diagnose()
-    print(json.dumps(report, indent=2))
+    _print_json(report)
 
 
 def _cmd_health_check(args: argparse.Namespace) -> None:
+    from tessrax.diagnostics.repository_health import RepositoryHealthChecker
+
     checker = RepositoryHealthChecker()
     report = checker.run()
-    print(json.dumps(report.__dict__, default=lambda o: o.__dict__, indent=2))
+    _print_json(report)
 
 
 def _cmd_repro_audit(args: argparse.Namespace) -> None:
+    from tessrax.diagnostics.reproducibility import audit_reproducibility
+
     report = audit_reproducibility()
-    print(json.dumps(report.__dict__, default=lambda o: o.__dict__, indent=2))
+    _print_json(report)
 
 
 def _cmd_snapshot_export(args: argparse.Namespace) -> None:
+    from tessrax.ledger.snapshots import export_snapshot
+
     snapshot = export_snapshot(snapshot_path=Path(args.output))
-    print(json.dumps(snapshot.__dict__, default=lambda o: o.__dict__, indent=2))
+    _print_json(snapshot)
 
 
 def _cmd_snapshot_restore(args: argparse.Namespace) -> None:
+    from tessrax.ledger.snapshots import restore_snapshot
+
     metadata = restore_snapshot(snapshot_path=Path(args.snapshot))
-    print(json.dumps(metadata.__dict__, indent=2))
+    _print_json(metadata)
 
 
 def _cmd_merkle_profile(args: argparse.Namespace) -> None:
+    from tessrax.ledger.merkle_profiler import profile_replay
+
     profile = profile_replay(ledger_path=Path(args.ledger), threshold_seconds=args.threshold)
-    print(json.dumps(profile.__dict__, indent=2))
+    _print_json(profile)
 
 
 def _cmd_divergence_scan(args: argparse.Namespace) -> None:
+    from tessrax.ledger.divergence import analyze_root_cause, scan_state_divergence
+
     report = scan_state_divergence(ledger_path=Path(args.ledger), index_path=Path(args.index), merkle_state_path=Path(args.merkle))
     rca = analyze_root_cause(report)
-    payload = {"report": report.__dict__, "root_cause": rca.__dict__}
-    print(json.dumps(payload, indent=2))
+    payload = {"report": report, "root_cause": rca}
+    _print_json(payload)
 
 
 def _cmd_cold_boot(args: argparse.Namespace) -> None:
+    from tessrax.diagnostics.cold_boot import run_cold_boot_audit
+
     audit = run_cold_boot_audit()
-    print(json.dumps(audit.__dict__, indent=2))
+    _print_json(audit)
 
 
 def _cmd_governance_replay(args: argparse.Namespace) -> None:
+    from tessrax.governance.coverage import governance_replay_simulator
+
     report = governance_replay_simulator(ledger_path=Path(args.ledger))
-    print(json.dumps(report.__dict__, indent=2))
+    _print_json(report)
 
 
 def _cmd_load_test(args: argparse.Namespace) -> None:
+    from tessrax.ledger.load_test import generate_high_volume_receipts
+
     summary = generate_high_volume_receipts(output_path=Path(args.output), batches=args.batches, batch_size=args.batch_size)
-    print(json.dumps(summary.__dict__, indent=2))
-
-
-COMMANDS = {
-    "auto-repair": _cmd_auto_repair,
-    "auto-diagnose": _cmd_auto_diag,
-    "rebuild-index": _cmd_rebuild_index,
-    "diff-receipts": _cmd_diff,
-    "explore-governance": _cmd_explore,
-    "stress-harness": _cmd_stress,
-    "export-architecture": _cmd_architecture,
-    "export-merkle-svg": _cmd_merkle_svg,
-    "health-check": _cmd_health_check,
-    "repro-audit": _cmd_repro_audit,
-    "snapshot-export": _cmd_snapshot_export,
-    "snapshot-restore": _cmd_snapshot_restore,
-    "merkle-profile": _cmd_merkle_profile,
-    "divergence-scan": _cmd_divergence_scan,
-    "cold-boot-audit": _cmd_cold_boot,
-    "governance-replay": _cmd_governance_replay,
-    "load-test": _cmd_load_test,
+    _print_json(summary)
+
+
+_Argument = tuple[str, dict[str, Any]]
+
+# name -> (handler, positional/optional arguments), in ``--help`` order.
+COMMAND_SPECS: dict[str, tuple[Callable[[argparse.Namespace], None], list[_Argument]]] = {
+    "auto-repair": (_cmd_auto_repair, []),
+    "auto-diagnose": (_cmd_auto_diag, []),
+    "rebuild-index": (_cmd_rebuild_index, []),
+    "diff-receipts": (_cmd_diff, [("left", {}), ("right", {})]),
+    "explore-governance": (_cmd_explore, []),
+    "stress-harness": (_cmd_stress, [("output", {}), ("--entries", {"type": int, "default": 10_000})]),
+    "export-architecture": (_cmd_architecture, [("output", {})]),
+    "export-merkle-svg": (_cmd_merkle_svg, [("output", {})]),
+    "health-check": (_cmd_health_check, []),
+    "repro-audit": (_cmd_repro_audit, []),
+    "snapshot-export": (_cmd_snapshot_export, [("output", {})]),
+    "snapshot-restore": (_cmd_snapshot_restore, [("snapshot", {})]),
+    "merkle-profile": (_cmd_merkle_profile, [("ledger", {}), ("--threshold", {"type": float, "default": 1.0})]),
+    "divergence-scan": (_cmd_divergence_scan, [("ledger", {}), ("index", {}), ("merkle", {})]),
+    "cold-boot-audit": (_cmd_cold_boot, []),
+    "governance-replay": (_cmd_governance_replay, [("ledger", {})]),
+    "load-test": (
+        _cmd_load_test,
+        [
+            ("output", {}),
+            ("--batches", {"type": int, "default": 5}),
+            ("--batch-size", {"type": int, "default": 2500}),
+        ],
+    ),
 }
+COMMANDS = {name: handler for name, (handler, _) in COMMAND_SPECS.items()}
 
 
 def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
     parser = argparse.ArgumentParser(prog="tessraxctl")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    subparsers.add_parser("auto-repair")
-    subparsers.add_parser("auto-diagnose")
-    subparsers.add_parser("rebuild-index")
-
-    diff_parser = subparsers.add_parser("diff-receipts")
-    diff_parser.add_argument("left")
-    diff_parser.add_argument("right")
-
-    subparsers.add_parser("explore-governance")
-
-    stress_parser = subparsers.add_parser("stress-harness")
-    stress_parser.add_argument("output")
-    stress_parser.add_argument("--entries", type=int, default=10_000)
-
-    arch_parser = subparsers.add_parser("export-architecture")
-    arch_parser.add_argument("output")
-
-    svg_parser = subparsers.add_parser("export-merkle-svg")
-    svg_parser.add_argument("output")
-
-    subparsers.add_parser("health-check")
-    subparsers.add_parser("repro-audit")
-
-    snapshot_export = subparsers.add_parser("snapshot-export")
-    snapshot_export.add_argument("output")
-
-    snapshot_restore = subparsers.add_parser("snapshot-restore")
-    snapshot_restore.add_argument("snapshot")
-
-    merkle_profile = subparsers.add_parser("merkle-profile")
-    merkle_profile.add_argument("ledger")
-    merkle_profile.add_argument("--threshold", type=float, default=1.0)
-
-    divergence = subparsers.add_parser("divergence-scan")
-    divergence.add_argument("ledger")
-    divergence.add_argument("index")
-    divergence.add_argument("merkle")
-
-    subparsers.add_parser("cold-boot-audit")
-
-    governance = subparsers.add_parser("governance-replay")
-    governance.add_argument("ledger")
-
-    load_test = subparsers.add_parser("load-test")
-    load_test.add_argument("output")
-    load_test.add_argument("--batches", type=int, default=5)
-    load_test.add_argument("--batch-size", type=int, default=2500)
+    # A recognised command only needs its own subparser; anything else (help,
+    # typos) gets the full set so usage and error messages list every command.
+    names = [argv[0]] if argv and argv[0] in COMMAND_SPECS else list(COMMAND_SPECS)
+    for name in names:
+        subparser = subparsers.add_parser(name)
+        for flag, options in COMMAND_SPECS[name][1]:
+            subparser.add_argument(flag, **options)
 
     args = parser.parse_args(argv)
     handler = COMMANDS[args.command]
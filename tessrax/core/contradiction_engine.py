@@ -16,15 +16,36 @@ start even when optional infrastructure such as SQLAlchemy is unavailable.
 
 from __future__ import annotations
 
+import atexit
 import dataclasses
 import importlib
-import importlib.util
+import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Iterable, List, Protocol, Sequence
+from typing import Iterable, Iterator, List, Protocol, Sequence
 
 INDEX_PATH = Path("tessrax/ledger/index.db")
 INDEX_TABLE = "ledger_index"
+INDEX_CACHE_KIB = 64 * 1024
+# Stay under SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+INDEX_QUERY_CHUNK = 900
+
+# sqlite3 connections are bound to the thread that opened them, so each thread
+# caches one connection, for the ``INDEX_PATH`` it was opened on (callers may
+# repoint it) and the file it found there: a rebuilt or deleted index gets a new
+# connection instead of reads from the unlinked inode.
+_local = threading.local()
+_open_connections: list[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+
+
+@dataclasses.dataclass(slots=True)
+class _CachedConnection:
+    path: Path
+    file_id: tuple[int, int] | None
+    con: sqlite3.Connection
+    schema_ready: bool = False
 
 
 class SupportsExecute(Protocol):
@@ -68,21 +89,22 @@ class _SQLAlchemyAdapter:
         _validate_session(session)
         self._session = session
         self._models = _load_models()
+        self._index_conn = _get_conn()
 
-    def contradiction_nodes(self) -> Iterable[ContradictionNode]:
+    def contradiction_nodes(self) -> Iterator[ContradictionNode]:
         select = _sqlalchemy_select()
         StateNode = self._models["StateNode"]
         stmt = select(StateNode).where(
             StateNode.is_contradiction.is_(True),
             StateNode.is_deleted.is_(False),
         )
-        return list(self._session.execute(stmt).scalars())
+        return iter(self._session.execute(stmt).scalars())
 
-    def contradiction_edges(self) -> Iterable[ContradictionEdge]:
+    def contradiction_edges(self) -> Iterator[ContradictionEdge]:
         select = _sqlalchemy_select()
         ActionEdge = self._models["ActionEdge"]
         stmt = select(ActionEdge).where(ActionEdge.is_contradiction.is_(True))
-        return list(self._session.execute(stmt).scalars())
+        return iter(self._session.execute(stmt).scalars())
 
 
 class _IterableAdapter:
@@ -91,17 +113,71 @@ class _IterableAdapter:
     def __init__(self, nodes: Iterable[ContradictionNode], edges: Iterable[ContradictionEdge]):
         self._nodes = list(nodes)
         self._edges = list(edges)
+        self._index_conn = _get_conn()
 
-    def contradiction_nodes(self) -> Iterable[ContradictionNode]:
-        return list(self._nodes)
+    def contradiction_nodes(self) -> Iterator[ContradictionNode]:
+        return iter(self._nodes)
 
-    def contradiction_edges(self) -> Iterable[ContradictionEdge]:
-        return list(self._edges)
+    def contradiction_edges(self) -> Iterator[ContradictionEdge]:
+        return iter(self._edges)
+
+
+def _file_id(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _cached_connection() -> _CachedConnection:
+    path = Path(INDEX_PATH)
+    file_id = _file_id(path)
+    cached: _CachedConnection | None = getattr(_local, "cached", None)
+    if cached is not None:
+        # While this connection is open its inode cannot be reused, so a
+        # matching (st_dev, st_ino) means the same file is still in place.
+        if cached.path == path and file_id is not None and cached.file_id == file_id:
+            return cached
+        _local.cached = None
+        with _connections_lock:
+            if cached.con in _open_connections:
+                _open_connections.remove(cached.con)
+        cached.con.close()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Only the owning thread uses it; the flag lets the atexit hook close it.
+    con = sqlite3.connect(path, check_same_thread=False)
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute(f"PRAGMA cache_size=-{INDEX_CACHE_KIB}")
+    with _connections_lock:
+        _open_connections.append(con)
+    cached = _local.cached = _CachedConnection(path, _file_id(path), con)
+    return cached
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's cached connection to the current ``INDEX_PATH``."""
+
+    return _cached_connection().con
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _connections_lock:
+        while _open_connections:
+            _open_connections.pop().close()
 
 
 def _ensure_index_schema() -> None:
-    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(INDEX_PATH) as con:
+    cached = _cached_connection()
+    if not cached.schema_ready:
+        _create_index_schema(cached.con)
+        cached.schema_ready = True
+
+
+def _create_index_schema(con: sqlite3.Connection) -> None:
+    with con:
         con.execute(
             f"""
             CREATE TABLE IF NOT EXISTS {INDEX_TABLE} (
@@ -117,7 +193,6 @@ def _ensure_index_schema() -> None:
         con.execute(
             f"CREATE INDEX IF NOT EXISTS idx_{INDEX_TABLE}_state_hash ON {INDEX_TABLE}(state_hash);"
         )
-        con.commit()
 
 
 def _load_models() -> dict:
@@ -135,15 +210,20 @@ def _validate_session(session: object) -> None:
         raise TypeError("session must expose an execute() method compatible with SQLAlchemy")
 
 
-def _state_processed(state_hash: str) -> bool:
-    if not state_hash:
-        return False
-    with sqlite3.connect(INDEX_PATH) as con:
+def _processed_hashes(state_hashes: Iterable[str], con: sqlite3.Connection) -> set[str]:
+    """Return the subset of ``state_hashes`` already recorded in the ledger index."""
+
+    pending = sorted({state_hash for state_hash in state_hashes if state_hash})
+    processed: set[str] = set()
+    for offset in range(0, len(pending), INDEX_QUERY_CHUNK):
+        chunk = pending[offset : offset + INDEX_QUERY_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
         cur = con.execute(
-            f"SELECT COUNT(1) FROM {INDEX_TABLE} WHERE state_hash = ?",
-            (state_hash,),
+            f"SELECT state_hash FROM {INDEX_TABLE} WHERE state_hash IN ({placeholders})",
+            chunk,
         )
-        return (cur.fetchone() or (0,))[0] > 0
+        processed.update(row[0] for row in cur)
+    return processed
 
 
 def _adapter_from(source, edges=None) -> RepositoryAdapter:
@@ -154,9 +234,7 @@ def _adapter_from(source, edges=None) -> RepositoryAdapter:
         return source  # type: ignore[return-value]
 
     if isinstance(source, Iterable):
-        nodes = list(source)
-        edges_iter = edges or []
-        return _IterableAdapter(nodes, edges_iter)
+        return _IterableAdapter(source, edges or [])
 
     raise TypeError(
         "Unsupported source for find_contradictions. Provide a SQLAlchemy session or iterables of nodes and edges."
@@ -170,37 +248,56 @@ def find_contradictions(source, *, edges: Sequence[ContradictionEdge] | None = N
     adapter = _adapter_from(source, edges)
     results: List[ContradictionNode] = []
     seen_ids: set[int] = set()
-    nodes = [n for n in adapter.contradiction_nodes() if n]
-    edges_data = list(adapter.contradiction_edges())
-
-    for node in nodes:
-        if not node.is_deleted and node.is_contradiction and not _state_processed(node.state_hash):
+    # One pass over the adapter: index every node for edge resolution and keep
+    # the flagged candidates in order, without a separate materialised list.
+    nodes_by_id: dict[int, ContradictionNode] = {}
+    candidates: List[ContradictionNode] = []
+    state_hashes: set[str] = set()
+    for node in adapter.contradiction_nodes():
+        if not node:
+            continue
+        nodes_by_id.setdefault(getattr(node, "id", 0), node)
+        state_hashes.add(node.state_hash)
+        if not node.is_deleted and node.is_contradiction:
+            candidates.append(node)
+    # Built-in adapters carry the index connection they were created with;
+    # caller-supplied repositories fall back to the thread's cached one.
+    index_conn = getattr(adapter, "_index_conn", None) or _get_conn()
+    processed = _processed_hashes(state_hashes, index_conn)
+
+    for node in candidates:
+        if node.state_hash not in processed:
             results.append(node)
             seen_ids.add(getattr(node, "id", 0))
 
-    for edge in edges_data:
+    for edge in adapter.contradiction_edges():
         if not edge.is_contradiction:
             continue
         target_id = getattr(edge, "to_node_id", None)
         if target_id in seen_ids or target_id is None:
             continue
-        for node in nodes:
-            if getattr(node, "id", None) == target_id and not _state_processed(node.state_hash):
-                results.append(node)
-                seen_ids.add(target_id)
-                break
+        node = nodes_by_id.get(target_id)
+        if node is not None and node.state_hash not in processed:
+            results.append(node)
+            seen_ids.add(target_id)
 
     return results
 
 
+_select = None
+
+
 def _sqlalchemy_select():
-    spec = importlib.util.find_spec("sqlalchemy")
-    if spec is None:  # pragma: no cover - executed only when dependency missing
-        raise RuntimeError(
-            "SQLAlchemy is not installed. Install it or pass iterables of nodes/edges to find_contradictions."
-        )
-    sqlalchemy_module = importlib.import_module("sqlalchemy")
-    return getattr(sqlalchemy_module, "select")
+    global _select
+    if _select is None:
+        try:
+            from sqlalchemy import select
+        except ImportError as exc:  # pragma: no cover - executed only when dependency missing
+            raise RuntimeError(
+                "SQLAlchemy is not installed. Install it or pass iterables of nodes/edges to find_contradictions."
+            ) from exc
+        _select = select
+    return _select
 
 
 __all__ = [
@@ -16,11 +16,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
 import os
 import signal
-import time
+import threading
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import List
 
 from sqlalchemy import create_engine, or_, select, update
 from sqlalchemy.orm import Session, sessionmaker
@@ -42,40 +43,60 @@ DB_URL = os.getenv(
 engine = create_engine(DB_URL, pool_pre_ping=True, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
 
-SHUTDOWN = False
 MAX_ATTEMPTS = int(os.getenv("TESSRAX_MAX_ATTEMPTS", "3"))
 POLL_INTERVAL_SECONDS = float(os.getenv("TESSRAX_POLL_INTERVAL", "1"))
 IDLE_SLEEP_SECONDS = float(os.getenv("TESSRAX_IDLE_SLEEP", "2"))
+CLAIM_BATCH_SIZE = int(os.getenv("TESSRAX_CLAIM_BATCH_SIZE", "100"))
+WORKER_COUNT = int(os.getenv("TESSRAX_CORE_WORKERS", "1"))
 
+_DECISION_EVENT_TYPES = {
+    "VERIFIED": "STATE_AUDITED",
+    "LOGGED": "CONTRADICTION_DETECTED",
+    "ESCALATE": "CONTRADICTION_DETECTED",
+    "DEFER": "CONTRADICTION_DETECTED",
+}
 
-def _signal_handler(sig, frame):
-    del sig, frame
-    global SHUTDOWN
-    SHUTDOWN = True
-    print("[CORE] Shutdown signal received. Draining loop...")
 
+def _install_signal_handlers(shutdown) -> None:
+    """Route SIGINT/SIGTERM to ``shutdown``; only the main thread may do this."""
 
-signal.signal(signal.SIGINT, _signal_handler)
-signal.signal(signal.SIGTERM, _signal_handler)
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    def _signal_handler(sig, frame):
+        del sig, frame
+        shutdown.set()
+        print("[CORE] Shutdown signal received. Draining loop...")
+
+    signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
+
+
+# Built once: json.dumps constructs a new encoder per call whenever options are
+# passed. The stdlib encoding (ASCII-escaped, repr floats) is kept because the
+# digest is embedded in existing receipts.
+_encode_integrity_payload = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
 
 
 def _integrity_digest(payload: dict) -> str:
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    canonical = _encode_integrity_payload(payload)
+    return hashlib.sha256(canonical.encode("ascii")).hexdigest()
 
 
 def _atomic_claim(db: Session, node: StateNode) -> bool:
+    # The claim commits together with the node's processing outcome; the row
+    # lock taken by the UPDATE keeps concurrent claimers out until then.
+    now = datetime.now(timezone.utc)
     stmt = (
         update(StateNode)
         .where(StateNode.id == node.id, StateNode.processed.is_(False))
-        .values(processed=True, processed_at=datetime.now(timezone.utc))
+        .values(processed=True, processed_at=now)
     )
     result = db.execute(stmt)
-    db.commit()
     claimed = result.rowcount == 1
     if claimed:
         node.processed = True
-        node.processed_at = datetime.now(timezone.utc)
+        node.processed_at = now
     return claimed
 
 
@@ -85,17 +106,34 @@ def _release_claim(db: Session, node: StateNode) -> None:
         .where(StateNode.id == node.id)
         .values(processed=False, processed_at=None)
     )
-    db.commit()
     node.processed = False
     node.processed_at = None
 
 
-def get_unprocessed_nodes(db: Session) -> Iterable[StateNode]:
-    stmt = select(StateNode).where(
-        StateNode.processed.is_(False),
-        StateNode.deleted_at.is_(None),
+def _claim_batch(db: Session, limit: int) -> List[StateNode]:
+    """Atomically claim up to ``limit`` pending nodes in a single statement.
+
+    ``SKIP LOCKED`` lets concurrent runners claim disjoint batches instead of
+    queueing on each other's rows; dialects without row locking ignore it.
+    """
+
+    pending = (
+        select(StateNode.id)
+        .where(StateNode.processed.is_(False), StateNode.deleted_at.is_(None))
+        .order_by(StateNode.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(StateNode)
+        .where(StateNode.id.in_(pending))
+        .values(processed=True, processed_at=datetime.now(timezone.utc))
+        .returning(StateNode)
     )
-    return db.execute(stmt).scalars().all()
+    nodes = list(db.scalars(stmt))
+    db.commit()
+    return nodes
 
 
 def _has_contradictory_edge(db: Session, node: StateNode) -> bool:
@@ -111,6 +149,24 @@ def _has_contradictory_edge(db: Session, node: StateNode) -> bool:
     return db.execute(stmt).first() is not None
 
 
+def _contradictory_node_ids(db: Session, node_ids: List[int]) -> set[int]:
+    """Return which of ``node_ids`` touch a live contradictory edge, in one query."""
+
+    if not node_ids:
+        return set()
+    stmt = select(ActionEdge.from_node_id, ActionEdge.to_node_id).where(
+        ActionEdge.deleted_at.is_(None),
+        ActionEdge.is_contradiction.is_(True),
+        or_(ActionEdge.from_node_id.in_(node_ids), ActionEdge.to_node_id.in_(node_ids)),
+    )
+    wanted = set(node_ids)
+    touched: set[int] = set()
+    for from_node_id, to_node_id in db.execute(stmt):
+        touched.add(from_node_id)
+        touched.add(to_node_id)
+    return touched & wanted
+
+
 def _record_governance_event(decision) -> None:
     if not getattr(decision, "state_hash", None):
         raise ValueError(
@@ -118,11 +174,8 @@ def _record_governance_event(decision) -> None:
         )
 
     decision_type = decision.decision
-    if decision_type == "VERIFIED":
-        event_type = "STATE_AUDITED"
-    elif decision_type in {"LOGGED", "ESCALATE", "DEFER"}:
-        event_type = "CONTRADICTION_DETECTED"
-    else:
+    event_type = _DECISION_EVENT_TYPES.get(decision_type)
+    if event_type is None:
         raise ValueError(f"Unsupported governance decision type: {decision_type}")
 
     payload = {
@@ -145,15 +198,28 @@ def _record_governance_event(decision) -> None:
 
 
 def _dead_letter(db: Session, node: StateNode, error_msg: str) -> None:
-    node.deleted_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    node.deleted_at = now
     node.last_error = error_msg
     node.processed = True
-    node.processed_at = datetime.now(timezone.utc)
-    db.commit()
+    node.processed_at = now
     print(f"[CORE] Node {node.id} moved to DEAD LETTER QUEUE.")
 
 
-def process_node(db: Session, node: StateNode) -> None:
+def process_node(
+    db: Session,
+    node: StateNode,
+    *,
+    claimed: bool = False,
+    contradictory: set[int] | None = None,
+) -> None:
+    """Classify and record ``node`` inside the caller's transaction.
+
+    Nothing is committed here; the caller commits once per batch. Each node's
+    work runs in a savepoint so a failure only rolls back that node before its
+    attempt counter and claim release are recorded.
+    """
+
     if node.deleted_at is not None:
         return
 
@@ -161,25 +227,28 @@ def process_node(db: Session, node: StateNode) -> None:
         _dead_letter(db, node, node.last_error or "Exceeded max attempts")
         return
 
-    if not _atomic_claim(db, node):
+    if not claimed and not _atomic_claim(db, node):
         return
 
     try:
-        if node.is_contradiction:
-            decision = classify_contradiction(node)
-            _record_governance_event(decision)
-        else:
-            if _has_contradictory_edge(db, node):
-                node.is_contradiction = True
-                db.commit()
+        with db.begin_nested():
+            if node.is_contradiction:
                 decision = classify_contradiction(node)
+                _record_governance_event(decision)
             else:
-                decision = classify_clean(node)
-            _record_governance_event(decision)
-
-        node.processing_attempts = 0
-        node.last_error = None
-        db.commit()
+                if contradictory is not None:
+                    has_contradictory_edge = node.id in contradictory
+                else:
+                    has_contradictory_edge = _has_contradictory_edge(db, node)
+                if has_contradictory_edge:
+                    node.is_contradiction = True
+                    decision = classify_contradiction(node)
+                else:
+                    decision = classify_clean(node)
+                _record_governance_event(decision)
+
+            node.processing_attempts = 0
+            node.last_error = None
 
     except Exception as exc:  # pragma: no cover - defensive runtime guard
         print(f"[CORE] ERROR processing node {node.id}: {exc}")
@@ -188,34 +257,68 @@ def process_node(db: Session, node: StateNode) -> None:
         if node.processing_attempts >= MAX_ATTEMPTS:
             _dead_letter(db, node, node.last_error)
         else:
-            db.commit()
             _release_claim(db, node)
         raise
 
 
-def run_loop() -> None:
+def run_loop(shutdown: threading.Event | None = None, *, batch_size: int = CLAIM_BATCH_SIZE) -> None:
+    if shutdown is None:
+        shutdown = threading.Event()
+    _install_signal_handlers(shutdown)
     print("[CORE] Tessrax OS v1.2.1 Core Runner online.")
 
-    while not SHUTDOWN:
+    while not shutdown.is_set():
         db = SessionLocal()
         try:
-            nodes = get_unprocessed_nodes(db)
+            nodes = _claim_batch(db, batch_size)
             if not nodes:
                 print("[CORE] No pending nodes.")
-                time.sleep(IDLE_SLEEP_SECONDS)
+                shutdown.wait(IDLE_SLEEP_SECONDS)
             else:
+                contradictory = _contradictory_node_ids(db, [node.id for node in nodes])
                 for node in nodes:
                     try:
-                        process_node(db, node)
+                        process_node(db, node, claimed=True, contradictory=contradictory)
                     except Exception:
                         continue
+                db.commit()
         finally:
             db.close()
 
-        time.sleep(POLL_INTERVAL_SECONDS)
+        shutdown.wait(POLL_INTERVAL_SECONDS)
 
     print("[CORE] Shutdown complete.")
 
 
+def _worker_main(shutdown, batch_size: int) -> None:
+    # Forked children must not reuse the parent's pooled DB connections.
+    engine.dispose(close=False)
+    run_loop(shutdown, batch_size=batch_size)
+
+
+def run_workers(workers: int = WORKER_COUNT) -> None:
+    """Run ``workers`` core-runner processes that claim disjoint batches.
+
+    ``_claim_batch`` locks with ``SKIP LOCKED``, so processes never claim the
+    same node and need no coordination beyond a shared shutdown event.
+    """
+
+    if workers <= 1:
+        run_loop()
+        return
+    context = multiprocessing.get_context("fork")
+    shutdown = context.Event()
+    batch_size = max(1, CLAIM_BATCH_SIZE // workers)
+    processes = [
+        context.Process(target=_worker_main, args=(shutdown, batch_size), name=f"core-runner-{index}")
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    _install_signal_handlers(shutdown)
+    for process in processes:
+        process.join()
+
+
 if __name__ == "__main__":
-    run_loop()
+    run_workers()
@@ -1,7 +1,7 @@
 """Structured error utilities for Tessrax subsystems."""
 from __future__ import annotations
 
-from typing import Mapping
+from typing import ClassVar, Mapping
 
 
 class TessraxError(RuntimeError):
@@ -13,42 +13,60 @@ class TessraxError(RuntimeError):
         self.code = code
         self.message = message
         self.details = details
-        super().__init__(f"[{self.code}] {self.message}")
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        # Formatted on demand: most raises are caught and classified, not printed.
+        return f"[{self.code}] {self.message}"
 
 
 class EpochError(TessraxError):
+    CODE: ClassVar[str] = "EPOCH_VIOLATION"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="EPOCH_VIOLATION", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class GovernanceTokenError(TessraxError):
+    CODE: ClassVar[str] = "GOV_TOKEN"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="GOV_TOKEN", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class LedgerRepairError(TessraxError):
+    CODE: ClassVar[str] = "LEDGER_REPAIR"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="LEDGER_REPAIR", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class PolicyError(TessraxError):
+    CODE: ClassVar[str] = "POLICY"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="POLICY", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class DiagnosticError(TessraxError):
+    CODE: ClassVar[str] = "DIAG"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="DIAG", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class SnapshotError(TessraxError):
+    CODE: ClassVar[str] = "SNAPSHOT"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="SNAPSHOT", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 class ReproducibilityError(TessraxError):
+    CODE: ClassVar[str] = "REPRO"
+
     def __init__(self, message: str, *, details: Mapping[str, object] | None = None):
-        super().__init__(code="REPRO", message=message, details=details)
+        super().__init__(code=self.CODE, message=message, details=details)
 
 
 def classify_failure(error: Exception) -> dict[str, object]:
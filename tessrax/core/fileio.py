@@ -0,0 +1,27 @@
+"""Atomic replacement of small state files."""
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` through a sibling temporary file and ``os.replace``.
+
+    Readers never observe a half-written file, and every write gives ``path``
+    a new inode, so caches stamped with ``(st_ino, st_size, st_mtime_ns)``
+    notice a rewrite even when the size and mtime are unchanged.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+__all__ = ["write_text_atomic"]
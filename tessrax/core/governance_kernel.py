@@ -9,9 +9,10 @@ ensures deterministic behaviour regardless of caller context.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Optional, Protocol
+import functools
+from typing import Iterable, Literal, NamedTuple, Optional, Protocol, Sequence
 import hashlib
+import re
 import urllib.parse
 
 from tessrax.core.time import canonical_datetime
@@ -28,15 +29,16 @@ class NodeView(Protocol):
     title: str | None
 
 
-@dataclass(slots=True, frozen=True)
-class Rationale:
+# Decisions are built once per classified node and only ever read; tuple-backed
+# records construct without the per-field object.__setattr__ of a frozen
+# dataclass and stay immutable.
+class Rationale(NamedTuple):
     summary: str
     evidence: dict
     rules_applied: tuple[str, ...]
 
 
-@dataclass(slots=True, frozen=True)
-class GovernanceDecision:
+class GovernanceDecision(NamedTuple):
     decision: DecisionType
     severity: SeverityTier
     rationale: Rationale
@@ -75,46 +77,118 @@ ROOT_PATTERNS = {
 }
 
 
+_SHA256 = hashlib.sha256()
+
+
 def _compute_digest(*fields: str) -> str:
-    joined = "|".join(fields)
-    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:32]
+    hasher = _SHA256.copy()
+    hasher.update("|".join(fields).encode("utf-8"))
+    return hasher.hexdigest()[:32]
+
+
+# Plain ``scheme://netloc/path`` and absolute ``/path`` URLs are split with one
+# regex match; anything urlparse would treat specially (params, brackets,
+# whitespace, non-ASCII hosts, relative paths) still goes through urlparse.
+_SIMPLE_URL_PATH_RE = re.compile(
+    r"(?:[a-z][a-z0-9+.\-]*://[^/?#\s;\[\]]*(/[^?#\s;]*)?|(/(?!/)[^?#\s;]*))(?:[?#]|\Z)"
+)
+_ROOT_PATH_RE = re.compile("|".join(re.escape(path) for path in ROOT_PATTERNS["paths"]))
+_ROOT_TITLE_RE = re.compile("|".join(re.escape(word) for word in ROOT_PATTERNS["title_keywords"]))
+
+
+def _url_path(url: str) -> str:
+    match = _SIMPLE_URL_PATH_RE.match(url) if url.isascii() else None
+    if match is None:
+        return urllib.parse.urlparse(url).path
+    return match.group(1) or match.group(2) or ""
+
+
+def _path_depth(path: str) -> int:
+    return len([part for part in path.split("/") if part])
 
 
 def _depth_from_url(url: str | None) -> int:
     if not url:
         return 0
-    path = urllib.parse.urlparse(url).path
-    return len([part for part in path.split("/") if part])
+    return _path_depth(_url_path(url))
 
 
-def _is_root_state(node: NodeView) -> bool:
-    url = (getattr(node, "url", None) or "").lower()
-    title = (getattr(node, "title", None) or "").lower()
-    parsed = urllib.parse.urlparse(url)
-    depth = _depth_from_url(url)
+def _root_state(url: str, title: str) -> bool:
+    path = _url_path(url) if url else ""
     return (
-        any(parsed.path.startswith(p) for p in ROOT_PATTERNS["paths"])
-        or any(keyword in title for keyword in ROOT_PATTERNS["title_keywords"])
-        or depth <= ROOT_PATTERNS["max_depth"]
+        _ROOT_PATH_RE.match(path) is not None
+        or _ROOT_TITLE_RE.search(title) is not None
+        or _path_depth(path) <= ROOT_PATTERNS["max_depth"]
+    )
+
+
+# Lower rank wins when a title carries several signals.
+_SIGNAL_RANK = {"ERROR_PAGE": 0, "NOT_FOUND_404": 1, "DISABLED_ACTION": 2, "BROKEN_LINK": 3}
+
+
+def _build_category_table() -> tuple[tuple[str, tuple[str, ...]], ...]:
+    signal_order = ("NOT_FOUND_404", "ERROR_PAGE", "DISABLED_ACTION", "BROKEN_LINK")
+    table = []
+    for mask in range(1 << len(signal_order)):
+        signals = tuple(name for bit, name in enumerate(signal_order) if mask >> bit & 1)
+        category = min(signals, key=_SIGNAL_RANK.__getitem__) if signals else "UNKNOWN"
+        table.append((category, signals))
+    return tuple(table)
+
+
+# Indexed by the signal bitmask built in _categorize_title (bit 0 = 404,
+# bit 1 = error, bit 2 = disabled, bit 3 = broken link).
+_CATEGORY_TABLE = _build_category_table()
+
+
+def _categorize_title(title: str) -> tuple[str, tuple[str, ...]]:
+    mask = (
+        ("404" in title or "not found" in title)
+        | ("error" in title or "exception" in title) << 1
+        | ("disabled" in title) << 2
+        | ("broken" in title and "link" in title) << 3
     )
+    return _CATEGORY_TABLE[mask]
+
+
+# Crawls revisit the same dashboards and error pages constantly; the traits
+# depend only on (url, title), so each distinct pair is parsed once.
+@functools.lru_cache(maxsize=8192)
+def _url_title_traits(url: str, title: str) -> tuple[bool, str, tuple[str, ...]]:
+    lowered_title = title.lower()
+    category, signals = _categorize_title(lowered_title)
+    return _root_state(url.lower(), lowered_title), category, signals
+
+
+def _node_traits(node: NodeView) -> tuple[bool, str, tuple[str, ...]]:
+    return _url_title_traits(getattr(node, "url", None) or "", getattr(node, "title", None) or "")
+
+
+def _node_fields(node: NodeView) -> tuple[str | None, str | None, int | None, str, str | None]:
+    """Read ``(url, title, id, id_text, state_hash)`` off ``node`` once.
+
+    ``id_text`` is the digest form: ``""`` when the attribute is absent, so a
+    node without ``id`` and one with ``id=None`` keep their distinct digests.
+    """
+
+    node_id = getattr(node, "id", None)
+    id_text = str(node_id) if node_id is not None or hasattr(node, "id") else ""
+    return (
+        getattr(node, "url", None),
+        getattr(node, "title", None),
+        node_id,
+        id_text,
+        getattr(node, "state_hash", None),
+    )
+
+
+def _is_root_state(node: NodeView) -> bool:
+    return _node_traits(node)[0]
 
 
 def _categorize(node: NodeView) -> tuple[str, tuple[str, ...]]:
-    title = (getattr(node, "title", None) or "").lower()
-    signals: list[str] = []
-    if "404" in title or "not found" in title:
-        signals.append("NOT_FOUND_404")
-    if "error" in title or "exception" in title:
-        signals.append("ERROR_PAGE")
-    if "disabled" in title or title.startswith("trap: disabled"):
-        signals.append("DISABLED_ACTION")
-    if "broken" in title and "link" in title:
-        signals.append("BROKEN_LINK")
-    if not signals:
-        return "UNKNOWN", tuple()
-    priority = ["ERROR_PAGE", "NOT_FOUND_404", "DISABLED_ACTION", "BROKEN_LINK"]
-    signals_sorted = sorted(signals, key=lambda s: priority.index(s))
-    return signals_sorted[0], tuple(signals)
+    _, category, signals = _node_traits(node)
+    return category, signals
 
 
 def _adjust_severity(base: SeverityTier, category: str, is_root: bool, signals: tuple[str, ...], title: str | None) -> SeverityTier:
@@ -146,37 +220,93 @@ def _timestamp() -> str:
     return canonical_datetime()
 
 
+# Tag and rule strings only ever take a handful of values; build them once
+# instead of formatting them for every decision.
+_SEVERITY_TIERS: tuple[SeverityTier, ...] = ("low", "medium", "high", "critical")
+_CATEGORY_TAG = {category: f"cat:{category}" for category in BASE_POLICY}
+_SEVERITY_TAG = {severity: f"severity:{severity}" for severity in _SEVERITY_TIERS}
+_BASELINE_RULE = {severity: f"baseline:{severity}" for severity in _SEVERITY_TIERS}
+_ADJUSTED_RULE = {severity: f"adjusted:{severity}" for severity in _SEVERITY_TIERS}
+_SIGNALS_RULE = {signals: f"signals:{','.join(signals) or 'none'}" for _, signals in _CATEGORY_TABLE}
+_ROOT_RULE = {is_root: f"root:{is_root}" for is_root in (False, True)}
+_POLICY_TAG: dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _policy_code(base_policy: str, version: str) -> str:
+    return f"{base_policy}@{version}"
+
+
+def _policy_tag(version: str) -> str:
+    tag = _POLICY_TAG.get(version)
+    if tag is None:
+        tag = _POLICY_TAG[version] = f"policy:{version}"
+    return tag
+
+
 def classify_contradiction(node: NodeView, *, recurrence_count: int = 0, first_seen: Optional[str] = None) -> GovernanceDecision:
-    category, signals = _categorize(node)
+    return _classify_contradiction(node, recurrence_count, first_seen, _policy_version())
+
+
+def classify_many(
+    nodes: Iterable[NodeView],
+    recurrences: Optional[Sequence[int]] = None,
+) -> list[GovernanceDecision]:
+    """Classify a batch of contradiction nodes under one policy version.
+
+    Equivalent to calling :func:`classify_contradiction` per node, except the
+    active policy version is resolved once for the whole batch.
+    ``recurrences`` supplies each node's ``recurrence_count`` (default 0).
+    """
+
+    policy_version = _policy_version()
+    if recurrences is None:
+        return [_classify_contradiction(node, 0, None, policy_version) for node in nodes]
+    nodes = list(nodes)
+    if len(recurrences) != len(nodes):
+        raise ValueError("recurrences must supply one count per node")
+    return [
+        _classify_contradiction(node, recurrence_count, None, policy_version)
+        for node, recurrence_count in zip(nodes, recurrences)
+    ]
+
+
+def _classify_contradiction(
+    node: NodeView,
+    recurrence_count: int,
+    first_seen: Optional[str],
+    policy_version: str,
+) -> GovernanceDecision:
+    url, title, node_id, id_text, state_hash = _node_fields(node)
+    is_root, category, signals = _url_title_traits(url or "", title or "")
     base_severity, base_policy = BASE_POLICY.get(category, BASE_POLICY["UNKNOWN"])
-    is_root = _is_root_state(node)
-    severity = _adjust_severity(base_severity, category, is_root, signals, getattr(node, "title", None))
+    severity = _adjust_severity(base_severity, category, is_root, signals, title)
     decision_type: DecisionType = "ESCALATE" if _should_escalate(severity, category, is_root, signals) else "LOGGED"
     now = _timestamp()
     rationale = Rationale(
         summary=f"Contradiction classified as {category} (severity={severity}).",
         evidence={
-            "url": getattr(node, "url", None),
-            "title": getattr(node, "title", None),
+            "url": url,
+            "title": title,
             "signals": list(signals),
             "is_root_state": is_root,
             "recurrence_count": recurrence_count,
         },
         rules_applied=(
-            f"baseline:{base_severity}",
-            f"adjusted:{severity}",
-            f"signals:{','.join(signals) or 'none'}",
-            f"root:{is_root}",
+            _BASELINE_RULE[base_severity],
+            _ADJUSTED_RULE[severity],
+            _SIGNALS_RULE[signals],
+            _ROOT_RULE[is_root],
         ),
     )
-    policy_code = f"{base_policy}@{_policy_version()}"
+    policy_code = _policy_code(base_policy, policy_version)
     digest = _compute_digest(
         decision_type,
         severity,
         policy_code,
         category,
-        str(getattr(node, "id", "")),
-        getattr(node, "state_hash", "") or "",
+        id_text,
+        state_hash or "",
         now,
     )
     return GovernanceDecision(
@@ -184,10 +314,10 @@ def classify_contradiction(node: NodeView, *, recurrence_count: int = 0, first_s
         severity=severity,
         rationale=rationale,
         policy_code=policy_code,
-        node_id=getattr(node, "id", None),
-        state_hash=getattr(node, "state_hash", None),
+        node_id=node_id,
+        state_hash=state_hash,
         category=category,
-        tags=("contradiction", f"cat:{category}", f"severity:{severity}", f"policy:{_policy_version()}"),
+        tags=("contradiction", _CATEGORY_TAG[category], _SEVERITY_TAG[severity], _policy_tag(policy_version)),
         recurrence_count=recurrence_count,
         first_seen=first_seen or now,
         last_seen=now,
@@ -197,26 +327,28 @@ def classify_contradiction(node: NodeView, *, recurrence_count: int = 0, first_s
 
 
 def classify_clean(node: NodeView, *, recurrence_count: int = 0, first_seen: Optional[str] = None) -> GovernanceDecision:
-    is_root = _is_root_state(node)
+    url, title, node_id, id_text, state_hash = _node_fields(node)
+    is_root = _url_title_traits(url or "", title or "")[0]
     severity: SeverityTier = "medium" if is_root else "low"
     now = _timestamp()
     rationale = Rationale(
         summary="Clean state verified.",
         evidence={
-            "url": getattr(node, "url", None),
-            "title": getattr(node, "title", None),
+            "url": url,
+            "title": title,
             "is_root_state": is_root,
         },
-        rules_applied=("clean_state", f"severity:{severity}"),
+        rules_applied=("clean_state", _SEVERITY_TAG[severity]),
     )
-    policy_code = f"POL#CLEAN_000@{_policy_version()}"
+    policy_version = _policy_version()
+    policy_code = _policy_code("POL#CLEAN_000", policy_version)
     digest = _compute_digest(
         "VERIFIED",
         severity,
         policy_code,
         "CLEAN",
-        str(getattr(node, "id", "")),
-        getattr(node, "state_hash", "") or "",
+        id_text,
+        state_hash or "",
         now,
     )
     return GovernanceDecision(
@@ -224,10 +356,10 @@ def classify_clean(node: NodeView, *, recurrence_count: int = 0, first_seen: Opt
         severity=severity,
         rationale=rationale,
         policy_code=policy_code,
-        node_id=getattr(node, "id", None),
-        state_hash=getattr(node, "state_hash", None),
+        node_id=node_id,
+        state_hash=state_hash,
         category="CLEAN",
-        tags=("clean", f"severity:{severity}", f"policy:{_policy_version()}"),
+        tags=("clean", _SEVERITY_TAG[severity], _policy_tag(policy_version)),
         recurrence_count=recurrence_count,
         first_seen=first_seen or now,
         last_seen=now,
@@ -236,4 +368,4 @@ def classify_clean(node: NodeView, *, recurrence_count: int = 0, first_seen: Opt
     )
 
 
-__all__ = ["GovernanceDecision", "Rationale", "classify_contradiction", "classify_clean"]
+__all__ = ["GovernanceDecision", "Rationale", "classify_contradiction", "classify_clean", "classify_many"]
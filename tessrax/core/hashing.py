@@ -4,6 +4,8 @@ from __future__ import annotations
 import hashlib
 import importlib
 import importlib.util
+import mmap
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping, Sequence
@@ -39,7 +41,7 @@ class DeterministicHasher:
         self._bytes = 0
 
     def update(self, data: bytes) -> "DeterministicHasher":
-        if not isinstance(data, (bytes, bytearray)):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError("Hasher update expects bytes-like input")
         self._hasher.update(data)
         self._bytes += len(data)
@@ -76,11 +78,22 @@ def blake3_digest(data: bytes) -> HashResult:
     return HashResult(algorithm="blake3", digest=hasher.hexdigest(), bytes_processed=len(data))
 
 
-def hash_paths(paths: Sequence[Path]) -> HashResult:
-    hasher = DeterministicHasher()
+def _update_from_file(hasher: DeterministicHasher, path: Path) -> None:
+    # Map the file rather than reading it so large evidence files are hashed
+    # straight from the page cache without a private copy.
+    with path.open("rb") as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                hasher.update(view)
+
+
+def hash_paths(paths: Sequence[Path], algorithm: str = "sha256") -> HashResult:
+    hasher = DeterministicHasher(algorithm)
     for path in sorted(Path(p) for p in paths):
-        data = path.read_bytes() if path.exists() else b""
-        hasher.update(data)
+        if path.exists():
+            _update_from_file(hasher, path)
     return hasher.digest()
 
 
@@ -12,8 +12,9 @@ class LedgerReplayEngine:
             raise ValueError("Ledger entries cannot be empty for replay engine construction.")
         # Sort the ledger_entries deterministically by their canonical serialization
         # This ensures that even if the input list order changes, the Merkle tree will be built consistently.
-        sorted_entries = sorted(ledger_entries, key=lambda entry: canonical_serialize(entry))
-        self._merkle_tree = MerkleTree(sorted_entries)
+        # Each entry is serialized once; the sorted bytes are the tree's leaves.
+        sorted_blocks = sorted(canonical_serialize(entry) for entry in ledger_entries)
+        self._merkle_tree = MerkleTree.from_canonical(sorted_blocks)
 
     def get_merkle_root(self) -> str:
         """Returns the Merkle root hash of the replayed ledger."""
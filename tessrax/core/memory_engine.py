@@ -16,6 +16,8 @@ import fcntl
 import hashlib
 import os
 import random
+import signal
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -24,8 +26,8 @@ from typing import Any, Mapping
 from nacl.signing import SigningKey
 
 from tessrax.core.serialization import (
-    canonical_json,
-    canonical_payload_hash,
+    canonical_json_bytes,
+    canonical_object_bytes,
     snapshot_payload,
 )
 from tessrax.core.time import canonical_datetime
@@ -34,13 +36,15 @@ from tessrax.infra import key_registry
 from tessrax.governance.token_guard import GovernanceTokenGuard
 from tessrax.ledger.epochal import EpochLedgerManager
 from tessrax.ledger.index_backend import IndexEntry, LedgerIndexBackend
-from tessrax.ledger.merkle import MerkleAccumulator
+from tessrax.ledger.merkle import MerkleAccumulator, MerkleUpdate
 
 LEDGER_PATH = Path("tessrax/ledger/ledger.jsonl")
 INDEX_PATH = Path("tessrax/ledger/index.db")
 MERKLE_STATE_PATH = Path("tessrax/ledger/merkle_state.json")
 AUDITOR_IDENTITY = "Tessrax Governance Kernel v16"
 CANONICAL_EVENT_TYPES: tuple[str, ...] = ("STATE_AUDITED", "CONTRADICTION_DETECTED")
+_CANONICAL_EVENT_TYPE_SET = frozenset(CANONICAL_EVENT_TYPES)
+_SHA256 = hashlib.sha256()
 
 
 @dataclass(slots=True)
@@ -68,14 +72,45 @@ def _load_active_key() -> tuple[str, SigningKey]:
     return key_id, signing_key
 
 
-@contextmanager
-def _acquire_mutex(handle) -> None:
+_LOCK_TIMEOUT = 5.0
+
+
+def _raise_lock_timeout(signum, frame) -> None:
+    raise TimeoutError("Unable to obtain ledger lock within backoff window")
+
+
+def _flock_with_deadline(fd: int) -> bool:
+    """Block in ``flock`` under a SIGALRM deadline; ``False`` if unavailable.
+
+    The kernel wakes a blocked waiter as soon as the holder unlocks, unlike
+    polling with sleeps. Signal handlers can only be installed from the main
+    thread, and an interval timer already in use must not be clobbered.
+    """
+
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    previous = signal.getsignal(signal.SIGALRM)
+    if previous is None or signal.getitimer(signal.ITIMER_REAL)[0]:
+        return False
+    signal.signal(signal.SIGALRM, _raise_lock_timeout)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, _LOCK_TIMEOUT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+    return True
+
+
+def _flock_with_backoff(fd: int) -> None:
     delay = 0.01
     max_delay = 0.5
     attempts = 0
     while True:
         try:
-            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
         except BlockingIOError:
             jitter = random.uniform(0.0, delay)
             time.sleep(delay + jitter)
@@ -84,122 +119,281 @@ def _acquire_mutex(handle) -> None:
             if attempts > 10:
                 raise TimeoutError("Unable to obtain ledger lock within backoff window")
         else:
-            try:
-                yield
-            finally:
-                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
-            break
+            return
+
+
+@contextmanager
+def _acquire_mutex(handle) -> None:
+    fd = handle.fileno()
+    if not _flock_with_deadline(fd):
+        _flock_with_backoff(fd)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in os.sysconf_names else 16
+
+
+def _writev_all(fd: int, chunks: list[bytes]) -> None:
+    """Write ``chunks`` in order with ``writev``, resuming after short writes."""
+
+    views = [memoryview(chunk) for chunk in chunks]
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start : start + _IOV_MAX])
+        while start < len(views) and written >= len(views[start]):
+            written -= len(views[start])
+            start += 1
+        if written:
+            views[start] = views[start][written:]
 
 
-def _append_to_ledger(entry: Mapping[str, Any]) -> int:
+def _append_to_ledger(lines: list[bytes]) -> int:
+    """Append ``lines`` with one writev and one fsync, returning the first line's offset."""
+
     LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    serialized = canonical_json(entry) + "\n"
-    with open(LEDGER_PATH, "a+", encoding="utf-8") as handle:
+    # Unbuffered: the lines go to the kernel straight from their own
+    # buffers, with no joined copy and no pass through a BufferedWriter.
+    with open(LEDGER_PATH, "ab", buffering=0) as handle:
+        fd = handle.fileno()
         with _acquire_mutex(handle):
-            handle.seek(0, os.SEEK_END)
-            offset = handle.tell()
-            handle.write(serialized)
-            handle.flush()
-            os.fsync(handle.fileno())
+            offset = os.lseek(fd, 0, os.SEEK_END)
+            _writev_all(fd, lines)
+        # The flock only orders the writes, so it is released before the
+        # fsync. That helps other processes appending to the ledger file
+        # directly; receipt writers still wait on the state lock, which
+        # spans the fsync. Threads in this process keep queueing for the
+        # next batch meanwhile, and the fsync still completes before any
+        # entry in this batch is indexed.
+        os.fsync(fd)
     return offset
 
 
-def _verify_inputs(event_type: str, payload: Mapping[str, Any], audited_state_hash: str) -> None:
-    if not isinstance(event_type, str) or not event_type.strip():
-        raise ValueError("event_type must be a non-empty string")
-    if event_type not in CANONICAL_EVENT_TYPES:
-        raise ValueError(
-            f"event_type must be one of {CANONICAL_EVENT_TYPES}, received {event_type!r}"
-        )
-    if not isinstance(payload, Mapping):
-        raise TypeError("payload must be a mapping")
-    if not isinstance(audited_state_hash, str) or len(audited_state_hash) < 8:
-        raise ValueError("audited_state_hash must be a non-empty hash string")
+@contextmanager
+def _state_lock() -> None:
+    """Order receipt writers across processes; the group commit orders threads."""
 
+    lock_path = MERKLE_STATE_PATH.with_name(MERKLE_STATE_PATH.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "ab") as handle, _acquire_mutex(handle):
+        yield
 
-def write_receipt(event_type: str, payload: Mapping[str, Any], audited_state_hash: str) -> Receipt:
-    _verify_inputs(event_type, payload, audited_state_hash)
-    index_backend = LedgerIndexBackend(index_path=INDEX_PATH)
-    index_backend.ensure_schema()
 
-    timestamp = canonical_datetime()
-    normalized_payload = snapshot_payload(payload)
-    if not is_frozen_payload(normalized_payload):  # pragma: no cover - defensive
-        raise TypeError("snapshot_payload must return FrozenPayload")
-    payload_hash = canonical_payload_hash(normalized_payload)
-    token_guard = GovernanceTokenGuard(
-        state_path=MERKLE_STATE_PATH.with_name("governance_token_state.json")
-    )
-    merkle_accumulator = MerkleAccumulator(state_path=MERKLE_STATE_PATH)
-    freshness_tag = token_guard.validate(
-        ledger_counter=merkle_accumulator.state.entry_count
+class _PendingReceipt:
+    __slots__ = (
+        "event_type",
+        "timestamp",
+        "payload",
+        "payload_bytes",
+        "payload_hash",
+        "audited_state_hash",
+        "line",
+        "index_entry",
+        "receipt",
+        "error",
+        "done",
     )
-    key_id, signing_key = _load_active_key()
-    canonical_event = {
-        "event_type": event_type,
-        "timestamp": timestamp,
-        "payload": normalized_payload,
-        "payload_hash": payload_hash,
-        "audited_state_hash": audited_state_hash,
-        "auditor": AUDITOR_IDENTITY,
-        "key_id": key_id,
+
+    def __init__(
+        self,
+        event_type: str,
+        timestamp: str,
+        payload: Mapping[str, Any],
+        payload_bytes: bytes,
+        payload_hash: str,
+        audited_state_hash: str,
+    ) -> None:
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.payload = payload
+        self.payload_bytes = payload_bytes
+        self.payload_hash = payload_hash
+        self.audited_state_hash = audited_state_hash
+        self.line = b""
+        self.index_entry: IndexEntry | None = None
+        self.receipt: Receipt | None = None
+        self.error: BaseException | None = None
+        self.done = False
+
+
+# Group commit: the first writer to find no flush in progress takes every
+# queued receipt and, under the state lock, chains, signs and appends them in
+# queue order with one flock, one write and one fsync. Writers that queue
+# meanwhile wait for it instead of each paying for their own fsync. Because
+# the flushing thread assigns previous_entry_hash, the Merkle position and the
+# epoch itself, the chain always follows append order.
+_pending_receipts: list[_PendingReceipt] = []
+_receipt_cond = threading.Condition()
+_receipt_flushing = False
+
+
+def _seal_receipt(
+    request: _PendingReceipt,
+    token_guard: GovernanceTokenGuard,
+    merkle_accumulator: MerkleAccumulator,
+    epoch_manager: EpochLedgerManager,
+    key_id: str,
+    signing_key: SigningKey,
+) -> MerkleUpdate:
+    """Chain ``request`` onto the accumulator's state and encode its ledger line."""
+
+    freshness_tag = token_guard.validate(ledger_counter=merkle_accumulator.state.entry_count)
+    # Each member value is encoded once; the signed event, the hashed ledger
+    # body and the appended entry are all assembled from the same fragments.
+    members = {
+        "event_type": canonical_json_bytes(request.event_type),
+        "timestamp": canonical_json_bytes(request.timestamp),
+        "payload": request.payload_bytes,
+        "payload_hash": canonical_json_bytes(request.payload_hash),
+        "audited_state_hash": canonical_json_bytes(request.audited_state_hash),
+        "auditor": canonical_json_bytes(AUDITOR_IDENTITY),
+        "key_id": canonical_json_bytes(key_id),
     }
 
-    canonical_str = canonical_json(canonical_event)
-    signature = signing_key.sign(canonical_str.encode("utf-8")).signature.hex()
+    signature = signing_key.sign(canonical_object_bytes(members)).signature.hex()
     previous_entry_hash = merkle_accumulator.state.last_leaf_hash
-    ledger_body = {
-        **canonical_event,
-        "signature": signature,
-        "previous_entry_hash": previous_entry_hash,
-        "governance_freshness_tag": freshness_tag,
-    }
-    entry_hash = hashlib.sha256(canonical_json(ledger_body).encode("utf-8")).hexdigest()
+    members["signature"] = canonical_json_bytes(signature)
+    members["previous_entry_hash"] = canonical_json_bytes(previous_entry_hash)
+    members["governance_freshness_tag"] = canonical_json_bytes(freshness_tag)
+    hasher = _SHA256.copy()
+    hasher.update(canonical_object_bytes(members))
+    entry_hash = hasher.hexdigest()
     merkle_update = merkle_accumulator.prepare_update(entry_hash)
-    epoch_manager = EpochLedgerManager(
-        state_path=MERKLE_STATE_PATH.with_name("epoch_state.json"),
-        snapshot_dir=MERKLE_STATE_PATH.parent,
-    )
     epoch_id = epoch_manager.record_entry(
         entry_hash=entry_hash,
-        timestamp=timestamp,
+        timestamp=request.timestamp,
         merkle_state=merkle_update.new_state,
     )
-    ledger_entry = {
-        **ledger_body,
-        "entry_hash": entry_hash,
-        "merkle_root": merkle_update.new_root,
-        "epoch_id": epoch_id,
-    }
-    offset = _append_to_ledger(ledger_entry)
-    index_backend.append(
-        IndexEntry(
-            ledger_offset=offset,
-            event_type=event_type,
-            state_hash=audited_state_hash,
-            payload_hash=payload_hash,
-            timestamp=timestamp,
-            merkle_root=merkle_update.new_root,
-            entry_hash=entry_hash,
-            previous_entry_hash=previous_entry_hash,
-        )
+    members["entry_hash"] = canonical_json_bytes(entry_hash)
+    members["merkle_root"] = canonical_json_bytes(merkle_update.new_root)
+    members["epoch_id"] = canonical_json_bytes(epoch_id)
+
+    request.line = canonical_object_bytes(members) + b"\n"
+    request.index_entry = IndexEntry(
+        ledger_offset=-1,
+        event_type=request.event_type,
+        state_hash=request.audited_state_hash,
+        payload_hash=request.payload_hash,
+        timestamp=request.timestamp,
+        merkle_root=merkle_update.new_root,
+        entry_hash=entry_hash,
+        previous_entry_hash=previous_entry_hash,
     )
-    merkle_accumulator.commit(merkle_update)
-
-    return Receipt(
-        event_type=event_type,
-        timestamp=timestamp,
-        payload=canonical_event["payload"],
-        payload_hash=payload_hash,
-        audited_state_hash=audited_state_hash,
+    request.receipt = Receipt(
+        event_type=request.event_type,
+        timestamp=request.timestamp,
+        payload=request.payload,
+        payload_hash=request.payload_hash,
+        audited_state_hash=request.audited_state_hash,
         signature=signature,
-        ledger_offset=offset,
+        ledger_offset=-1,
         previous_entry_hash=previous_entry_hash,
         entry_hash=entry_hash,
         merkle_root=merkle_update.new_root,
         epoch_id=epoch_id,
         governance_freshness_tag=freshness_tag,
     )
+    # The next receipt in the batch chains onto this one; the state is only
+    # persisted once the whole batch is on disk.
+    merkle_accumulator.state = merkle_update.new_state
+    return merkle_update
+
+
+def _commit_receipts(batch: list[_PendingReceipt]) -> None:
+    index_backend = LedgerIndexBackend(index_path=INDEX_PATH)
+    with _state_lock():
+        token_guard = GovernanceTokenGuard(
+            state_path=MERKLE_STATE_PATH.with_name("governance_token_state.json")
+        )
+        merkle_accumulator = MerkleAccumulator(state_path=MERKLE_STATE_PATH)
+        epoch_manager = EpochLedgerManager(
+            state_path=MERKLE_STATE_PATH.with_name("epoch_state.json"),
+            snapshot_dir=MERKLE_STATE_PATH.parent,
+        )
+        key_id, signing_key = _load_active_key()
+        sealed: list[_PendingReceipt] = []
+        merkle_update = None
+        for request in batch:
+            try:
+                merkle_update = _seal_receipt(
+                    request, token_guard, merkle_accumulator, epoch_manager, key_id, signing_key
+                )
+            except Exception as exc:
+                request.error = exc
+            else:
+                sealed.append(request)
+        if not sealed:
+            return
+        offset = _append_to_ledger([request.line for request in sealed])
+        for request in sealed:
+            request.index_entry.ledger_offset = request.receipt.ledger_offset = offset
+            offset += len(request.line)
+        # One executemany and one SQLite commit for the whole batch.
+        index_backend.extend(request.index_entry for request in sealed)
+        merkle_accumulator.commit(merkle_update)
+
+
+def _verify_inputs(event_type: str, payload: Mapping[str, Any], audited_state_hash: str) -> None:
+    # One set lookup accepts every valid event type; the finer-grained
+    # checks below only run to pick the error message.
+    if not (isinstance(event_type, str) and event_type in _CANONICAL_EVENT_TYPE_SET):
+        if not isinstance(event_type, str) or not event_type.strip():
+            raise ValueError("event_type must be a non-empty string")
+        raise ValueError(
+            f"event_type must be one of {CANONICAL_EVENT_TYPES}, received {event_type!r}"
+        )
+    if not isinstance(payload, Mapping):
+        raise TypeError("payload must be a mapping")
+    if not isinstance(audited_state_hash, str) or len(audited_state_hash) < 8:
+        raise ValueError("audited_state_hash must be a non-empty hash string")
+
+
+def write_receipt(event_type: str, payload: Mapping[str, Any], audited_state_hash: str) -> Receipt:
+    global _receipt_flushing
+
+    _verify_inputs(event_type, payload, audited_state_hash)
+    LedgerIndexBackend(index_path=INDEX_PATH).ensure_schema()
+
+    timestamp = canonical_datetime()
+    normalized_payload = snapshot_payload(payload)
+    if not is_frozen_payload(normalized_payload):  # pragma: no cover - defensive
+        raise TypeError("snapshot_payload must return FrozenPayload")
+    # A snapshot is already normalised, so these are exactly the bytes
+    # canonical_payload_hash would hash; they also become the payload member.
+    payload_bytes = canonical_json_bytes(normalized_payload)
+    payload_hasher = _SHA256.copy()
+    payload_hasher.update(payload_bytes)
+    payload_hash = payload_hasher.hexdigest()
+
+    request = _PendingReceipt(
+        event_type, timestamp, normalized_payload, payload_bytes, payload_hash, audited_state_hash
+    )
+    with _receipt_cond:
+        _pending_receipts.append(request)
+        while _receipt_flushing and not request.done:
+            _receipt_cond.wait()
+        if not request.done:
+            _receipt_flushing = True
+            batch = _pending_receipts[:]
+            _pending_receipts.clear()
+    if not request.done:
+        try:
+            _commit_receipts(batch)
+        except BaseException as exc:
+            for pending in batch:
+                if pending.error is None:
+                    pending.error = exc
+        finally:
+            with _receipt_cond:
+                for pending in batch:
+                    pending.done = True
+                _receipt_flushing = False
+                _receipt_cond.notify_all()
+    if request.error is not None:
+        raise request.error
+    return request.receipt
 
 
 __all__ = [
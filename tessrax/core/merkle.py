@@ -1,10 +1,22 @@
 """Merkle tree implementation for Tessrax."""
 from __future__ import annotations
 
+import functools
+import hashlib
 import math
-from typing import List, Any, Optional
+from typing import Iterable, List, Any, Optional
 from tessrax.core.serialization import canonical_serialize
-from tessrax.core.hashing import DeterministicHasher, HashResult
+
+# Same SHA-256 digests DeterministicHasher produces, without building a
+# hasher object and a HashResult for every node of the tree.
+_SHA256 = hashlib.sha256()
+
+
+def _sha256_hex(*chunks: bytes) -> str:
+    hasher = _SHA256.copy()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 class MerkleNode:
@@ -15,15 +27,10 @@ class MerkleNode:
         if hash_value is None:
             # If it's a leaf node and data_hash is provided
             if data_hash is not None:
-                hasher = DeterministicHasher()
-                hasher.update(data_hash)  # Use the pre-canonicalized data hash
-                self.hash_value = hasher.digest().digest
+                self.hash_value = _sha256_hex(data_hash)  # Use the pre-canonicalized data hash
             # If it's an internal node, hash children's hashes
             elif left is not None and right is not None:
-                hasher = DeterministicHasher()
-                hasher.update(left.hash_value.encode('utf-8'))
-                hasher.update(right.hash_value.encode('utf-8'))
-                self.hash_value = hasher.digest().digest
+                self.hash_value = _sha256_hex(left.hash_value.encode('utf-8'), right.hash_value.encode('utf-8'))
             elif left is not None:  # Single child case for odd number of leaves
                 self.hash_value = left.hash_value
             else:
@@ -40,28 +47,48 @@ class MerkleTree:
     def __init__(self, data_blocks: List[Any]) -> None:
         if not data_blocks:
             raise ValueError("Data blocks cannot be empty for MerkleTree construction.")
-        self.leaves: List[MerkleNode] = []
-        for block in data_blocks:
-            # Canonicalize block here before creating the leaf node
-            canonical_block_bytes = canonical_serialize(block)
-            self.leaves.append(MerkleNode(None, None, data_hash=canonical_block_bytes))
-        self.root: MerkleNode = self._build_tree(self.leaves)
-
-    def _build_tree(self, nodes: List[MerkleNode]) -> MerkleNode:
-        if len(nodes) == 1:
-            return nodes[0]
-        next_level: List[MerkleNode] = []
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            right = nodes[i + 1] if i + 1 < len(nodes) else left  # Handle odd number of leaves by duplicating the last one
-            parent = MerkleNode(left, right)
-            next_level.append(parent)
-        return self._build_tree(next_level)
+        # Canonicalize each block before creating its leaf node
+        self._build_from_canonical(canonical_serialize(block) for block in data_blocks)
+
+    @classmethod
+    def from_canonical(cls, canonical_blocks: Iterable[bytes]) -> "MerkleTree":
+        """Build a tree from blocks that are already ``canonical_serialize`` output."""
+        tree = cls.__new__(cls)
+        tree._build_from_canonical(canonical_blocks)
+        if not tree.levels:
+            raise ValueError("Data blocks cannot be empty for MerkleTree construction.")
+        return tree
+
+    def _build_from_canonical(self, canonical_blocks: Iterable[bytes]) -> None:
+        # Hashes are kept as flat per-level lists, leaves first; MerkleNode
+        # objects are only materialised if a caller asks for them.
+        level = [_sha256_hex(block) for block in canonical_blocks]
+        self.levels: List[List[str]] = [level] if level else []
+        while len(level) > 1:
+            children = [hash_value.encode("utf-8") for hash_value in level]
+            if len(children) % 2:
+                children.append(children[-1])  # Handle odd number of leaves by duplicating the last one
+            level = [_sha256_hex(children[i], children[i + 1]) for i in range(0, len(children), 2)]
+            self.levels.append(level)
+
+    @functools.cached_property
+    def leaves(self) -> List[MerkleNode]:
+        return [MerkleNode(None, None, hash_value=hash_value) for hash_value in self.levels[0]]
+
+    @functools.cached_property
+    def root(self) -> MerkleNode:
+        nodes = self.leaves
+        for level in self.levels[1:]:
+            nodes = [
+                MerkleNode(nodes[2 * i], nodes[min(2 * i + 1, len(nodes) - 1)], hash_value=hash_value)
+                for i, hash_value in enumerate(level)
+            ]
+        return nodes[0]
 
     @property
     def root_hash(self) -> str:
         """Returns the root hash of the Merkle tree."""
-        return self.root.hash_value
+        return self.levels[-1][0]
 
 
 __all__ = ["MerkleNode", "MerkleTree"]
@@ -23,40 +23,70 @@ class ReceiptPayloadModel:
 
     @classmethod
     def model_validate(cls, data: Mapping[str, Any]) -> "ReceiptPayloadModel":
-        required = [
-            "event_type",
-            "timestamp",
-            "payload",
-            "payload_hash",
-            "audited_state_hash",
-            "key_id",
-            "signature",
-            "entry_hash",
-            "merkle_root",
-        ]
-        for field in required:
-            if field not in data:
-                raise ValueError(f"Missing receipt field '{field}'")
-            if not isinstance(data[field], str) and field != "payload":
-                raise TypeError(f"Field '{field}' must be a string")
-        signature = data["signature"]
+        # Straight-line lookups and checks for the common valid receipt; the
+        # field-by-field walk only runs to report the first problem in order.
+        try:
+            event_type = data["event_type"]
+            timestamp = data["timestamp"]
+            payload = data["payload"]
+            payload_hash = data["payload_hash"]
+            audited_state_hash = data["audited_state_hash"]
+            key_id = data["key_id"]
+            signature = data["signature"]
+            entry_hash = data["entry_hash"]
+            merkle_root = data["merkle_root"]
+        except KeyError:
+            _raise_field_error(data)
+            raise
+        if not (
+            isinstance(event_type, str)
+            and isinstance(timestamp, str)
+            and isinstance(payload_hash, str)
+            and isinstance(audited_state_hash, str)
+            and isinstance(key_id, str)
+            and isinstance(signature, str)
+            and isinstance(entry_hash, str)
+            and isinstance(merkle_root, str)
+        ):
+            _raise_field_error(data)
         if len(signature) < 32:
             raise ValueError("signature must be hex-like")
         return cls(
-            event_type=str(data["event_type"]),
-            timestamp=str(data["timestamp"]),
-            payload=data["payload"],
-            payload_hash=str(data["payload_hash"]),
-            audited_state_hash=str(data["audited_state_hash"]),
+            event_type=str(event_type),
+            timestamp=str(timestamp),
+            payload=payload,
+            payload_hash=str(payload_hash),
+            audited_state_hash=str(audited_state_hash),
             auditor=data.get("auditor"),
-            key_id=str(data["key_id"]),
+            key_id=str(key_id),
             signature=signature,
             previous_entry_hash=data.get("previous_entry_hash"),
-            entry_hash=str(data["entry_hash"]),
-            merkle_root=str(data["merkle_root"]),
+            entry_hash=str(entry_hash),
+            merkle_root=str(merkle_root),
             epoch_id=data.get("epoch_id"),
             governance_freshness_tag=data.get("governance_freshness_tag"),
         )
 
 
+_REQUIRED_FIELDS = (
+    "event_type",
+    "timestamp",
+    "payload",
+    "payload_hash",
+    "audited_state_hash",
+    "key_id",
+    "signature",
+    "entry_hash",
+    "merkle_root",
+)
+
+
+def _raise_field_error(data: Mapping[str, Any]) -> None:
+    for field in _REQUIRED_FIELDS:
+        if field not in data:
+            raise ValueError(f"Missing receipt field '{field}'")
+        if not isinstance(data[field], str) and field != "payload":
+            raise TypeError(f"Field '{field}' must be a string")
+
+
 __all__ = ["ReceiptPayloadModel"]
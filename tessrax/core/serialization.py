@@ -14,18 +14,63 @@ from decimal import Decimal
 import hashlib
 import json
 import math
-from typing import Any, cast
+from typing import Any, Iterable, cast
+
+try:  # Optional accelerator; only used where its output matches the stdlib.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# Cloning a pristine context skips the argument parsing and EVP lookup that
+# ``hashlib.sha256()`` pays on every call; it matters for sub-KB payloads.
+_SHA256 = hashlib.sha256()
+
+# json.dumps builds a fresh JSONEncoder on every call once any option is set;
+# one shared encoder (they are stateless between calls) skips that setup.
+# Every caller encodes a tree freshly rebuilt by _materialize_for_json or
+# _normalize, which would already have recursed forever on a cycle, so the
+# encoder's own circular-reference bookkeeping is skipped.
+_encode_canonical = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    check_circular=False,
+).encode
 
 
 def canonical_json(payload: Mapping[str, Any]) -> str:
     """Return deterministic JSON for ``payload`` (AEP-001 compliant)."""
 
-    materialized = _materialize_for_json(payload)
-    return json.dumps(
-        materialized,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
+    encoded = _orjson_canonical(payload)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return _encode_canonical(_materialize_for_json(payload))
+
+
+def canonical_json_bytes(payload: Mapping[str, Any]) -> bytes:
+    """Return :func:`canonical_json` output as the UTF-8 bytes hashed and signed."""
+
+    encoded = _orjson_canonical(payload)
+    if encoded is not None:
+        return encoded
+    return _encode_canonical(_materialize_for_json(payload)).encode("utf-8")
+
+
+def canonical_object_bytes(members: Mapping[str, bytes]) -> bytes:
+    """Assemble canonical JSON object bytes from pre-encoded member values.
+
+    ``members`` maps each key to the :func:`canonical_json_bytes` encoding of
+    its value, so a value encoded once can be shared by several enclosing
+    objects. Keys are emitted in the same sorted order as the encoder uses.
+    """
+
+    return (
+        b"{"
+        + b",".join(
+            _encode_canonical(key).encode("utf-8") + b":" + members[key]
+            for key in sorted(members)
+        )
+        + b"}"
     )
 
 
@@ -134,6 +179,92 @@ def _materialize_for_json(value: Any) -> Any:
     return value
 
 
+class _StdlibOnly(Exception):
+    """A value orjson would encode differently from the canonical encoder."""
+
+
+# orjson encodes integers only within [-2**63, 2**64), and switches floats to
+# exponent notation at different magnitudes than ``float.__repr__`` (1e16 vs
+# 1e+16, 0.00001 vs 1e-05). Inside these bounds both emit identical bytes.
+_ORJSON_INT_MIN = -(1 << 63)
+_ORJSON_INT_MAX = 1 << 64
+
+
+def _materialize_for_orjson(value: Any) -> Any:
+    """Same tree as :func:`_materialize_for_json`, restricted to leaves that
+    orjson encodes byte-for-byte like ``_encode_canonical``."""
+
+    if isinstance(value, FrozenPayload):
+        return {key: _materialize_for_orjson(val) for key, val in value.items()}
+    if isinstance(value, Mapping):
+        return {str(key): _materialize_for_orjson(val) for key, val in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [_materialize_for_orjson(item) for item in value]
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return value
+    if value_type is int and _ORJSON_INT_MIN <= value < _ORJSON_INT_MAX:
+        return value
+    if value_type is float and (value == 0.0 or 1e-4 <= abs(value) < 1e16):
+        return value
+    raise _StdlibOnly
+
+
+def _orjson_safe(value: Any) -> bool:
+    """Whether orjson encodes ``value`` in place exactly like the stdlib path.
+
+    Checks the leaves :func:`_materialize_for_orjson` would accept without
+    building the copy; FrozenPayload nodes are resolved by :func:`_frozen_data`.
+    """
+
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is FrozenPayload:
+        return all(map(_orjson_safe, value._data.values()))
+    if value_type is dict:
+        return all(map(_orjson_safe, value.values()))
+    if value_type is tuple or value_type is list:
+        return all(map(_orjson_safe, value))
+    if value_type is int:
+        return _ORJSON_INT_MIN <= value < _ORJSON_INT_MAX
+    if value_type is float:
+        return value == 0.0 or 1e-4 <= abs(value) < 1e16
+    return False
+
+
+def _frozen_data(value: Any) -> Any:
+    if type(value) is FrozenPayload:
+        return value._data
+    raise TypeError
+
+
+def _orjson_canonical(payload: Mapping[str, Any]) -> bytes | None:
+    """Encode ``payload`` with orjson, or return ``None`` to use the stdlib."""
+
+    if orjson is None:
+        return None
+    if type(payload) is FrozenPayload:
+        # Snapshots are immutable trees of FrozenPayload, tuples and scalars;
+        # orjson can walk them directly instead of a materialised copy.
+        if not _orjson_safe(payload):
+            return None
+        try:
+            return orjson.dumps(
+                payload,
+                default=_frozen_data,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            return None
+    try:
+        return orjson.dumps(_materialize_for_orjson(payload), option=orjson.OPT_SORT_KEYS)
+    except (_StdlibOnly, orjson.JSONEncodeError):
+        # Unsupported leaves, lone surrogates, non-str FrozenPayload keys and
+        # over-deep nesting all take the stdlib path (and its errors).
+        return None
+
+
 def canonical_payload_hash(payload: Mapping[str, Any]) -> str:
     """Hash ``payload`` after canonical normalisation (TESST verified)."""
 
@@ -141,7 +272,15 @@ def canonical_payload_hash(payload: Mapping[str, Any]) -> str:
         canonical_payload = payload
     else:
         canonical_payload = normalize_payload(payload)
-    return hashlib.sha256(canonical_json(canonical_payload).encode("utf-8")).hexdigest()
+    hasher = _SHA256.copy()
+    hasher.update(canonical_json_bytes(canonical_payload))
+    return hasher.hexdigest()
+
+
+def canonical_payload_hashes(payloads: Iterable[Mapping[str, Any]]) -> list[str]:
+    """Hash each of ``payloads`` exactly as :func:`canonical_payload_hash` would."""
+
+    return [canonical_payload_hash(payload) for payload in payloads]
 
 
 def canonical_serialize(obj: Any) -> bytes:
@@ -151,20 +290,16 @@ def canonical_serialize(obj: Any) -> bytes:
     standardizing float and datetime representations, and then serializes it
     to a compact JSON string, finally encoding it to UTF-8 bytes.
     """
-    normalized_obj = _normalize(obj)
-    json_string = json.dumps(
-        normalized_obj,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
-    return json_string.encode("utf-8")
+    return _encode_canonical(_normalize(obj)).encode("utf-8")
 
 
 __all__ = [
     "FrozenPayload",
     "canonical_json",
+    "canonical_json_bytes",
+    "canonical_object_bytes",
     "canonical_payload_hash",
+    "canonical_payload_hashes",
     "canonical_serialize",
     "normalize_payload",
     "snapshot_payload",
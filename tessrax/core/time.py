@@ -1,11 +1,60 @@
 """Canonical datetime helpers enforcing UTC + ISO-8601 with ``Z`` suffix."""
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent call; the date and
+# time fields only change once a second, so only the fraction is formatted
+# per call.
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def _now_split() -> tuple[str, int]:
+    """Return ("YYYY-MM-DDTHH:MM:SS", nanoseconds) for the current UTC time."""
+
+    global _second_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _second_prefix
+    if seconds != cached_second:
+        tm = time.gmtime(seconds)
+        prefix = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        )
+        _second_prefix = (seconds, prefix)
+    return prefix, nanos
+
+
+def _now_canonical() -> str:
+    """Format the current time exactly as ``canonical_datetime()`` does.
+
+    Millisecond precision, with no fraction at all when it is zero, matching
+    ``isoformat()``'s omission of a zero microsecond field.
+    """
+
+    prefix, nanos = _now_split()
+    millis = nanos // 1_000_000
+    if millis:
+        return f"{prefix}.{millis:03d}000Z"
+    return prefix + "Z"
+
+
+def utc_now_isoformat() -> str:
+    """Return the current time formatted like ``datetime.now(timezone.utc).isoformat()``."""
+
+    prefix, nanos = _now_split()
+    micros = nanos // 1_000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return prefix + "+00:00"
+
+
 def canonical_datetime(dt: datetime | None = None) -> str:
-    reference = dt.astimezone(timezone.utc) if dt else datetime.now(timezone.utc)
+    if not dt:
+        return _now_canonical()
+    reference = dt.astimezone(timezone.utc)
     normalized = reference.replace(microsecond=reference.microsecond // 1000 * 1000)
     return normalized.isoformat().replace("+00:00", "Z")
 
@@ -15,4 +64,4 @@ def parse_canonical_datetime(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
-__all__ = ["canonical_datetime", "parse_canonical_datetime"]
+__all__ = ["canonical_datetime", "parse_canonical_datetime", "utc_now_isoformat"]
@@ -5,6 +5,7 @@ from tessrax.core.governance_kernel import (
     Rationale,
     classify_clean,
     classify_contradiction,
+    classify_many,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "Rationale",
     "classify_clean",
     "classify_contradiction",
+    "classify_many",
 ]
@@ -6,6 +6,7 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from tessrax.core.errors import PolicyError
+from tessrax.core.fileio import write_text_atomic
 from tessrax.core.time import canonical_datetime
 
 POLICY_STATE_PATH = Path("tessrax/governance/policy_state.json")
@@ -22,6 +23,15 @@ class PolicySnapshot:
 class PolicyRegistry:
     def __init__(self, path: Path = POLICY_STATE_PATH) -> None:
         self.path = path
+        # (file stamp, active version) from the last read of ``path``.
+        self._active_cache: tuple[tuple, str] | None = None
+
+    def _stamp(self) -> tuple | None:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (self.path, st.st_ino, st.st_size, st.st_mtime_ns)
 
     def _load(self) -> dict:
         if not self.path.exists():
@@ -32,12 +42,22 @@ class PolicyRegistry:
         return json.loads(raw.decode("utf-8"))
 
     def _save(self, payload: dict) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        self._active_cache = None
+        # A new inode per save keeps _stamp distinct across same-size rewrites.
+        write_text_atomic(self.path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
 
     def active_version(self) -> str:
-        state = self._load()
-        return state.get("active_version", "v1.3")
+        """Return the pinned version, re-reading the state file only when it changes."""
+
+        stamp = self._stamp()
+        if stamp is None:
+            return "v1.3"
+        cached = self._active_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        version = self._load().get("active_version", "v1.3")
+        self._active_cache = (stamp, version)
+        return version
 
     def pin(self, version: str, *, reason: str, approver: str) -> PolicySnapshot:
         if not version:
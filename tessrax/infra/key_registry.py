@@ -28,6 +28,8 @@ from typing import Any, Dict, List, Tuple
 
 from nacl.signing import SigningKey
 
+from tessrax.core.fileio import write_text_atomic
+
 AUDITOR_IDENTITY = "Tessrax Governance Kernel v16"
 SIGNING_KEYS_DIR = Path("tessrax/infra/signing_keys")
 LEGACY_PRIVATE_KEY_PATH = Path("tessrax/infra/signing_key.pem")
@@ -36,6 +38,10 @@ ACTIVE_KEY_PATH = SIGNING_KEYS_DIR / "active_key.json"
 ROTATION_STATE_PATH = SIGNING_KEYS_DIR / "rotation_state.json"
 ROTATION_RECEIPTS_PATH = SIGNING_KEYS_DIR / "rotation_receipts.json"
 
+# (stamp, (key_id, SigningKey)) for the last key handed out; see
+# ``load_active_signing_key``.
+_active_key_cache: tuple[tuple, Tuple[str, SigningKey]] | None = None
+
 DEFAULT_POLICY = {
     "min_hours_between_rotations": 1.0,
     "max_active_age_hours": 720.0,  # 30 days
@@ -69,8 +75,9 @@ def _load_json(path: Path) -> Dict[str, Any]:
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Replaced rather than rewritten in place: _active_key_stamp relies on
+    # every save producing a new inode.
+    write_text_atomic(path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
 
 
 def _private_key_path(key_id: str) -> Path:
@@ -94,6 +101,8 @@ def _read_state() -> Dict[str, Any]:
 
 
 def _save_state(state: Dict[str, Any]) -> None:
+    global _active_key_cache
+    _active_key_cache = None
     _write_json(ROTATION_STATE_PATH, state)
 
 
@@ -319,8 +328,30 @@ def _bootstrap_if_needed() -> RotationState:
     return RotationState(active_key=key_id, state=state)
 
 
+def _active_key_stamp() -> tuple | None:
+    """Identify the on-disk rotation state, or ``None`` when it is missing."""
+
+    try:
+        st = ROTATION_STATE_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return (ROTATION_STATE_PATH, SIGNING_KEYS_DIR, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
 def load_active_signing_key() -> Tuple[str, SigningKey]:
-    """Return the active ``(key_id, SigningKey)`` tuple, bootstrapping if needed."""
+    """Return the active ``(key_id, SigningKey)`` tuple, bootstrapping if needed.
+
+    The key is cached until ``rotation_state.json`` changes on disk (a
+    rotation in any process rewrites it) or this process saves new state, so
+    signing a receipt costs one ``stat`` instead of a state parse and a key
+    load.
+    """
+
+    global _active_key_cache
+    stamp = _active_key_stamp()
+    cached = _active_key_cache
+    if cached is not None and stamp is not None and cached[0] == stamp:
+        return cached[1]
 
     rotation_state = _bootstrap_if_needed()
     key_id = rotation_state.active_key
@@ -331,6 +362,9 @@ def load_active_signing_key() -> Tuple[str, SigningKey]:
     if len(raw) != 64:
         raise RuntimeError("Stored key material must be 32-byte hex seed")
     signing_key = SigningKey(bytes.fromhex(raw))
+    # Stamped before reading: a rotation racing this load only costs a reload.
+    if stamp is not None:
+        _active_key_cache = (stamp, (key_id, signing_key))
     return key_id, signing_key
 
 
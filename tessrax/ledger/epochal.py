@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from tessrax.core.errors import EpochError
+from tessrax.core.fileio import write_text_atomic
 from tessrax.core.time import canonical_datetime
 from tessrax.ledger.merkle import MerkleState
 
@@ -13,6 +14,21 @@ EPOCH_STATE_PATH = Path("tessrax/ledger/epoch_state.json")
 SNAPSHOT_PATTERN = "merkle_state-{epoch_id}.json"
 
 
+def _file_stamp(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+# (file stamp, parsed state) per epoch state file, from the last read or write
+# in this process. The table grows with every entry, so re-parsing it on each
+# receipt made appends linear in ledger length. Saves replace the file, so
+# each one changes the stamp's inode.
+_state_cache: dict[Path, tuple[tuple, Dict[str, Any]]] = {}
+
+
 class EpochLedgerManager:
     """Assigns canonical epoch IDs to ledger entries and exports snapshots."""
 
@@ -26,19 +42,29 @@ class EpochLedgerManager:
         self.snapshot_dir = snapshot_dir or state_path.parent
 
     def _load_state(self) -> Dict[str, Any]:
-        if not self.state_path.exists():
+        stamp = _file_stamp(self.state_path)
+        if stamp is None:
             return {"next_epoch": 0, "entries": {}}
+        cached = _state_cache.get(self.state_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         raw = self.state_path.read_bytes()
         if not raw.strip():
             return {"next_epoch": 0, "entries": {}}
         data = json.loads(raw.decode("utf-8"))
         data.setdefault("entries", {})
         data.setdefault("next_epoch", 0)
+        _state_cache[self.state_path] = (stamp, data)
         return data
 
     def _save_state(self, state: Dict[str, Any]) -> None:
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        # ``state`` may be the cached dict, already mutated by the caller; drop
+        # it first so a failed write cannot leave it looking current.
+        _state_cache.pop(self.state_path, None)
+        write_text_atomic(self.state_path, json.dumps(state, indent=2, sort_keys=True) + "\n")
+        stamp = _file_stamp(self.state_path)
+        if stamp is not None:
+            _state_cache[self.state_path] = (stamp, state)
 
     def _snapshot_path(self, epoch_id: str) -> Path:
         return self.snapshot_dir / SNAPSHOT_PATTERN.format(epoch_id=epoch_id)
@@ -1,9 +1,11 @@
 """Index backend abstraction with write-ahead logging and feature-flagged storage."""
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Mapping
@@ -14,6 +16,90 @@ from tessrax.core.time import canonical_datetime
 LEDGER_INDEX_PATH = Path("tessrax/ledger/index.db")
 WAL_PATH = LEDGER_INDEX_PATH.with_suffix(".wal.jsonl")
 ROCKS_EMULATION_PATH = Path("tessrax/ledger/rocksdb_index.json")
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO ledger_index (
+        ledger_offset, event_type, state_hash, payload_hash,
+        timestamp, merkle_root, entry_hash, previous_entry_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# One writer connection per index file, shared by every backend instance in
+# the process. The lock serialises both the cache and the statements run on
+# the shared connections.
+_connections: dict[Path, sqlite3.Connection] = {}
+_connections_lock = threading.RLock()
+
+
+_SYNC_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _synchronous_mode() -> str:
+    # The ledger file is the durable record (auto_repair rebuilds the index
+    # from it), so by default index commits only need to survive a process
+    # crash; operators can trade that either way.
+    mode = os.getenv("TESSRAX_SQLITE_SYNC", "NORMAL").upper()
+    if mode not in _SYNC_MODES:
+        raise LedgerRepairError("Unknown SQLite synchronous mode", details={"mode": mode})
+    return mode
+
+
+def _open_connection(index_path: Path, *, create_schema: bool = True) -> sqlite3.Connection:
+    synchronous = _synchronous_mode()
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(index_path, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute(f"PRAGMA synchronous={synchronous}")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    if create_schema:
+        _create_schema(con)
+        con.commit()
+    return con
+
+
+def _create_schema(con: sqlite3.Connection) -> None:
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ledger_index (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ledger_offset INTEGER NOT NULL UNIQUE,
+            event_type TEXT NOT NULL,
+            state_hash TEXT NOT NULL,
+            payload_hash TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            merkle_root TEXT,
+            entry_hash TEXT,
+            previous_entry_hash TEXT
+        );
+        """
+    )
+    con.execute("CREATE INDEX IF NOT EXISTS idx_state_hash ON ledger_index(state_hash);")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ledger_index(timestamp);")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_entry_hash ON ledger_index(entry_hash);")
+
+
+def _connection(index_path: Path) -> sqlite3.Connection:
+    with _connections_lock:
+        con = _connections.get(index_path)
+        if con is None:
+            con = _connections[index_path] = _open_connection(index_path)
+        return con
+
+
+def _close_connections() -> None:
+    with _connections_lock:
+        while _connections:
+            _connections.popitem()[1].close()
+
+
+def _forget_connections() -> None:
+    # A forked child must not touch SQLite handles opened by its parent.
+    _connections.clear()
+
+
+atexit.register(_close_connections)
+os.register_at_fork(after_in_child=_forget_connections)
 
 
 @dataclass(slots=True)
@@ -33,10 +119,13 @@ class IndexWriteAheadLog:
         self.path = path or WAL_PATH
 
     def append(self, payload: Mapping[str, object]) -> None:
+        self.extend((payload,))
+
+    def extend(self, payloads: Iterable[Mapping[str, object]]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = json.dumps(payload, sort_keys=True)
+        serialized = "".join(json.dumps(payload, sort_keys=True) + "\n" for payload in payloads)
         with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(serialized + "\n")
+            handle.write(serialized)
 
     def drain(self) -> list[dict]:
         if not self.path.exists():
@@ -65,9 +154,15 @@ class JsonKeyValueIndex:
                 handle.write(json.dumps(entry, sort_keys=True) + "\n")
 
     def append(self, entry: Mapping[str, object]) -> None:
-        entries = self._load()
-        entries.append(dict(entry))
-        self._save(entries)
+        self.extend((entry,))
+
+    def extend(self, entries: Iterable[Mapping[str, object]]) -> None:
+        # The file is one JSON record per line, so appending never needs to
+        # read or rewrite the records already stored.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        serialized = "".join(json.dumps(dict(entry), sort_keys=True) + "\n" for entry in entries)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(serialized)
 
     def rebuild(self, entries: Iterable[Mapping[str, object]]) -> None:
         self._save(entries)
@@ -91,27 +186,7 @@ class LedgerIndexBackend:
     def ensure_schema(self) -> None:
         if self.backend == "rocksdb":
             return
-        self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.index_path) as con:
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ledger_index (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ledger_offset INTEGER NOT NULL UNIQUE,
-                    event_type TEXT NOT NULL,
-                    state_hash TEXT NOT NULL,
-                    payload_hash TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    merkle_root TEXT,
-                    entry_hash TEXT,
-                    previous_entry_hash TEXT
-                );
-                """
-            )
-            con.execute("CREATE INDEX IF NOT EXISTS idx_state_hash ON ledger_index(state_hash);")
-            con.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ledger_index(timestamp);")
-            con.execute("CREATE INDEX IF NOT EXISTS idx_entry_hash ON ledger_index(entry_hash);")
-            con.commit()
+        _connection(self.index_path)
 
     @staticmethod
     def _entry_to_payload(entry: IndexEntry) -> dict:
@@ -126,44 +201,60 @@ class LedgerIndexBackend:
             "previous_entry_hash": entry.previous_entry_hash,
         }
 
-    def _insert_sqlite(self, entry: IndexEntry) -> None:
-        with sqlite3.connect(self.index_path) as con:
-            con.execute(
-                """
-                INSERT OR REPLACE INTO ledger_index (
-                    ledger_offset, event_type, state_hash, payload_hash,
-                    timestamp, merkle_root, entry_hash, previous_entry_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry.ledger_offset,
-                    entry.event_type,
-                    entry.state_hash,
-                    entry.payload_hash,
-                    entry.timestamp,
-                    entry.merkle_root,
-                    entry.entry_hash,
-                    entry.previous_entry_hash,
-                ),
-            )
-            con.commit()
+    @staticmethod
+    def _entry_to_row(entry: IndexEntry) -> tuple:
+        return (
+            entry.ledger_offset,
+            entry.event_type,
+            entry.state_hash,
+            entry.payload_hash,
+            entry.timestamp,
+            entry.merkle_root,
+            entry.entry_hash,
+            entry.previous_entry_hash,
+        )
+
+    def _insert_sqlite(self, entries: Iterable[IndexEntry]) -> None:
+        with _connections_lock:
+            con = _connection(self.index_path)
+            with con:
+                con.executemany(_INSERT_SQL, map(self._entry_to_row, entries))
 
     def append(self, entry: IndexEntry) -> None:
-        payload = self._entry_to_payload(entry) | {"written_at": canonical_datetime()}
-        self.wal.append(payload)
+        self.extend((entry,))
+
+    def extend(self, entries: Iterable[IndexEntry]) -> None:
+        """Index ``entries`` with one WAL write and one SQLite transaction."""
+
+        entries = list(entries)
+        written_at = canonical_datetime()
+        payloads = [self._entry_to_payload(entry) | {"written_at": written_at} for entry in entries]
+        self.wal.extend(payloads)
         if self.backend == "sqlite":
-            self._insert_sqlite(entry)
+            self._insert_sqlite(entries)
         else:
-            JsonKeyValueIndex(self.rocks_path).append(payload)
+            JsonKeyValueIndex(self.rocks_path).extend(payloads)
         self.wal.drain()
 
     def rebuild(self, entries: Iterable[IndexEntry]) -> None:
         if self.backend == "sqlite":
-            if self.index_path.exists():
-                self.index_path.unlink()
-            self.ensure_schema()
-            for entry in entries:
-                self._insert_sqlite(entry)
+            # Rebuilt in place rather than by unlinking the file: other
+            # connections (the contradiction engine's per-thread readers, other
+            # processes) keep using index.db and its -wal/-shm, and see either
+            # the old index or the new one once this transaction commits.
+            with _connections_lock:
+                con = _connections.get(self.index_path)
+                if con is None:
+                    # Skip the schema check: the table is replaced below, even
+                    # when an incompatible one is what needs repairing.
+                    con = _connections[self.index_path] = _open_connection(
+                        self.index_path, create_schema=False
+                    )
+                with con:
+                    con.execute("BEGIN IMMEDIATE")
+                    con.execute("DROP TABLE IF EXISTS ledger_index")
+                    _create_schema(con)
+                    con.executemany(_INSERT_SQL, map(self._entry_to_row, entries))
         else:
             JsonKeyValueIndex(self.rocks_path).rebuild(
                 self._entry_to_payload(entry) for entry in entries
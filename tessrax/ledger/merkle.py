@@ -4,28 +4,32 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
-from tessrax.core.serialization import canonical_json
+from tessrax.core.fileio import write_text_atomic
+from tessrax.core.serialization import canonical_json, canonical_json_bytes
+from tessrax.core.time import utc_now_isoformat
 
 LEDGER_PATH = Path("tessrax/ledger/ledger.jsonl")
 MERKLE_STATE_PATH = Path("tessrax/ledger/merkle_state.json")
 AUDITOR_IDENTITY = "Tessrax Governance Kernel v16"
 EMPTY_ROOT = hashlib.sha256(b"TESSRAX|MERKLE|EMPTY").hexdigest()
+_SHA256 = hashlib.sha256()
 
 
 class MerkleVerificationError(RuntimeError):
     """Raised when Merkle chain validation fails."""
 
 
+# Byte concatenation feeds one-shot hashlib calls the same bytes as UTF-8
+# encoding a formatted str, without the intermediate string.
 def _hash_leaf(leaf_hash: str) -> str:
-    return hashlib.sha256(f"leaf:{leaf_hash}".encode("utf-8")).hexdigest()
+    return hashlib.sha256(b"leaf:" + leaf_hash.encode("utf-8")).hexdigest()
 
 
 def _hash_node(left: str, right: str) -> str:
-    return hashlib.sha256(f"node:{left}:{right}".encode("utf-8")).hexdigest()
+    return hashlib.sha256(b"node:" + left.encode("utf-8") + b":" + right.encode("utf-8")).hexdigest()
 
 
 @dataclass(frozen=True)
@@ -87,6 +91,21 @@ class MerkleUpdate:
     new_root: str
 
 
+def _file_stamp(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+# (file stamp, state) per state file, from the last read or write in this
+# process. Accumulators are built per receipt, so without this every receipt
+# re-reads and re-parses a file this process has just written. Saves replace
+# the file, so each one changes the stamp's inode.
+_state_cache: dict[Path, tuple[tuple, MerkleState]] = {}
+
+
 class MerkleAccumulator:
     """Persistent Merkle accumulator backed by ``MERKLE_STATE_PATH``."""
 
@@ -95,13 +114,19 @@ class MerkleAccumulator:
         self.state = self._load_state()
 
     def _load_state(self) -> MerkleState:
-        if not self.state_path.exists():
+        stamp = _file_stamp(self.state_path)
+        if stamp is None:
             return MerkleState.empty()
+        cached = _state_cache.get(self.state_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         raw = self.state_path.read_bytes()
         if not raw.strip():
-            return MerkleState.empty()
-        payload = json.loads(raw.decode("utf-8"))
-        return MerkleState.from_payload(payload)
+            state = MerkleState.empty()
+        else:
+            state = MerkleState.from_payload(json.loads(raw.decode("utf-8")))
+        _state_cache[self.state_path] = (stamp, state)
+        return state
 
     def prepare_update(self, leaf_hash: str) -> MerkleUpdate:
         new_state = self.state.apply_leaf(leaf_hash)
@@ -112,24 +137,26 @@ class MerkleAccumulator:
         )
 
     def commit(self, update: MerkleUpdate) -> str:
+        # prepare_update already folded the peaks into new_root; reuse it
+        # rather than folding them twice more here.
         self.state = update.new_state
-        self._persist_state()
-        return self.state.root()
+        self._persist_state(root=update.new_root)
+        return update.new_root
 
-    def _persist_state(self) -> None:
+    def _persist_state(self, root: str | None = None) -> None:
         payload = self.state.to_payload()
         payload.update(
             auditor=AUDITOR_IDENTITY,
-            updated_at=datetime.now(timezone.utc).isoformat(),
-            root=self.state.root(),
+            updated_at=utc_now_isoformat(),
+            root=self.state.root() if root is None else root,
         )
         canonical = canonical_json(payload)
         payload["integrity"] = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(
-            json.dumps(payload, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
+        _state_cache.pop(self.state_path, None)
+        write_text_atomic(self.state_path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
+        stamp = _file_stamp(self.state_path)
+        if stamp is not None:
+            _state_cache[self.state_path] = (stamp, self.state)
 
 
 def _entry_body(entry: Mapping[str, Any]) -> Mapping[str, Any]:
@@ -151,8 +178,9 @@ def _entry_body(entry: Mapping[str, Any]) -> Mapping[str, Any]:
 def compute_entry_hash(entry: Mapping[str, Any]) -> str:
     """Reconstruct the canonical entry hash from a ledger record."""
 
-    body = _entry_body(entry)
-    return hashlib.sha256(canonical_json(body).encode("utf-8")).hexdigest()
+    hasher = _SHA256.copy()
+    hasher.update(canonical_json_bytes(_entry_body(entry)))
+    return hasher.hexdigest()
 
 
 def verify_merkle(
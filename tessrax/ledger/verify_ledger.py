@@ -23,7 +23,7 @@ from nacl.signing import VerifyKey
 from tessrax.core.errors import TessraxError
 from tessrax.core.memory_engine import CANONICAL_EVENT_TYPES
 from tessrax.core.models import ReceiptPayloadModel
-from tessrax.core.serialization import canonical_json, canonical_payload_hash
+from tessrax.core.serialization import canonical_json_bytes, canonical_payload_hash
 from tessrax.ledger.epochal import EpochLedgerManager, EpochError
 from tessrax.ledger.merkle import MerkleAccumulator, MerkleState, compute_entry_hash
 
@@ -170,7 +170,7 @@ def _verify_signature(record: dict, verify_keys: Dict[str, VerifyKey], line_no:
     if "auditor" in record:
         signed_body["auditor"] = record["auditor"]
 
-    message = canonical_json(signed_body).encode()
+    message = canonical_json_bytes(signed_body)
 
     signature_hex = record.get("signature")
     if not isinstance(signature_hex, str):
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+
+from server.services import engine
+
+
+class _Upload:
+    def __init__(self, filename: str, data: bytes) -> None:
+        self.filename = filename
+        self._stream = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+def _text_artifact(name: str, content: str) -> dict:
+    return {
+        "type": "text",
+        "name": name,
+        "content": content,
+        "sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+    }
+
+
+def test_duplicate_uploads_are_reported_but_analysed_once() -> None:
+    uploads = [_Upload("a.pdf", b"same"), _Upload("b.pdf", b"same"), _Upload("c.pdf", b"other")]
+    artifacts, counts = asyncio.run(engine.ingest_data(files=uploads, text="same", url=None))
+    assert counts == {"file": 3, "text": 1, "url": 0}
+    assert [artifact.get("name") for artifact in artifacts if artifact["type"] == "file"] == [
+        "a.pdf",
+        "b.pdf",
+        "c.pdf",
+    ]
+    # A text artifact never collapses into a file with the same digest.
+    assert engine.run_deterministic_core(artifacts) != engine.run_deterministic_core(artifacts[1:])
+
+    first = _text_artifact("first", "APR: 5% Effective: Jan 2024")
+    second = _text_artifact("second", "APR: 7% Effective: Jan 2024")
+    repeated = [first, dict(first), second, dict(second)]
+    result = engine.run_engine(repeated)
+    assert result["merkleRoot"] == engine.run_deterministic_core([first, second])
+    assert len(result["contradictions"]) == 1
+    assert result["findings"] == engine.run_engine([first, second])["findings"]
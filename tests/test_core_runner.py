@@ -0,0 +1,104 @@
+"""Batch claim and per-node transaction tests for the core runner."""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+# The governance package has to load before the kernel module it re-exports.
+import tessrax.governance  # noqa: E402,F401
+from tessrax.services.proceduralist.database import models  # noqa: E402
+
+
+@pytest.fixture()
+def core_runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TESSRAX_DB_URL", f"sqlite:///{tmp_path / 'proceduralist.db'}")
+    module = importlib.reload(importlib.import_module("tessrax.core.core_runner"))
+    models.Base.metadata.create_all(module.engine)
+    yield module
+    module.engine.dispose()
+
+
+def _seed(core_runner, count: int) -> list[int]:
+    with core_runner.SessionLocal() as db:
+        nodes = [
+            models.StateNode(state_hash=f"{index:064x}", url=f"https://example.org/{index}", title=f"node-{index}")
+            for index in range(count)
+        ]
+        db.add_all(nodes)
+        db.commit()
+        return [node.id for node in nodes]
+
+
+def test_claim_batch_claims_disjoint_pending_nodes(core_runner) -> None:
+    ids = _seed(core_runner, 6)
+    with core_runner.SessionLocal() as db:
+        db.get(models.StateNode, ids[0]).processed = True
+        db.get(models.StateNode, ids[1]).deleted_at = core_runner.datetime.now(core_runner.timezone.utc)
+        db.commit()
+
+    with core_runner.SessionLocal() as db:
+        first = [node.id for node in core_runner._claim_batch(db, 2)]
+    with core_runner.SessionLocal() as db:
+        second = [node.id for node in core_runner._claim_batch(db, 2)]
+    with core_runner.SessionLocal() as db:
+        assert core_runner._claim_batch(db, 2) == []
+
+    assert sorted(first) == ids[2:4]
+    assert sorted(second) == ids[4:6]
+    with core_runner.SessionLocal() as db:
+        for node_id in first + second:
+            node = db.get(models.StateNode, node_id)
+            assert node.processed is True
+            assert node.processed_at is not None
+
+
+def test_failing_node_rolls_back_alone_within_batch(core_runner, monkeypatch: pytest.MonkeyPatch) -> None:
+    ids = _seed(core_runner, 3)
+    failing_id = ids[1]
+    with core_runner.SessionLocal() as db:
+        # Both edges mark their nodes as contradictions inside the savepoint.
+        db.add_all(
+            [
+                models.ActionEdge(from_node_id=ids[0], to_node_id=ids[2], is_contradiction=True),
+                models.ActionEdge(from_node_id=failing_id, to_node_id=ids[2], is_contradiction=True),
+            ]
+        )
+        db.commit()
+
+    recorded: list[int] = []
+    shutdown = core_runner.threading.Event()
+
+    def _record(decision) -> None:
+        if decision.node_id == failing_id:
+            raise RuntimeError("ledger unavailable")
+        recorded.append(decision.node_id)
+
+    real_claim_batch = core_runner._claim_batch
+
+    def _claim_once(db, limit):
+        shutdown.set()
+        return real_claim_batch(db, limit)
+
+    monkeypatch.setattr(core_runner, "_record_governance_event", _record)
+    monkeypatch.setattr(core_runner, "_claim_batch", _claim_once)
+    monkeypatch.setattr(core_runner, "_install_signal_handlers", lambda shutdown: None)
+    monkeypatch.setattr(core_runner, "POLL_INTERVAL_SECONDS", 0)
+    core_runner.run_loop(shutdown, batch_size=10)
+
+    assert sorted(recorded) == [ids[0], ids[2]]
+    with core_runner.SessionLocal() as db:
+        failing = db.get(models.StateNode, failing_id)
+        assert failing.is_contradiction is False
+        assert failing.processing_attempts == 1
+        assert failing.last_error == "ledger unavailable"
+        assert failing.processed is False
+        assert failing.processed_at is None
+        for node_id in (ids[0], ids[2]):
+            node = db.get(models.StateNode, node_id)
+            assert node.is_contradiction is True
+            assert node.processed is True
+            assert node.processing_attempts == 0
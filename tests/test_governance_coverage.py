@@ -3,8 +3,14 @@ from __future__ import annotations
 import importlib
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
-from tessrax.governance import coverage
+import pytest
+
+from tessrax.core import contradiction_engine
+from tessrax.core.contradiction_engine import ContradictionNode
+from tessrax.governance import classify_contradiction, classify_many, coverage
+from tessrax.ledger.index_backend import IndexEntry, LedgerIndexBackend
 from tessrax.ledger.stress_harness import generate_stress_ledger
 
 
@@ -54,3 +60,36 @@ def test_multisig_rotation_verifier(tmp_path: Path) -> None:
     assert set(report.approvals_present) == {"alpha", "beta"}
     assert report.latest_receipt_hash is not None
     os.environ.pop("TESSRAX_REQUIRED_APPROVERS", None)
+
+
+def test_find_contradictions_sees_rebuilt_index(tmp_path: Path, monkeypatch) -> None:
+    index_path = tmp_path / "index.db"
+    monkeypatch.setattr(contradiction_engine, "INDEX_PATH", index_path)
+    backend = LedgerIndexBackend(index_path=index_path, backend="sqlite")
+    backend.ensure_schema()
+    state_hash = "ab" * 32
+    backend.append(IndexEntry(0, "STATE_AUDITED", state_hash, "p", "t", "m", "e", None))
+    node = ContradictionNode(id=1, state_hash=state_hash, is_contradiction=True)
+
+    assert contradiction_engine.find_contradictions([node]) == []
+    backend.rebuild([])
+    assert contradiction_engine.find_contradictions([node]) == [node]
+
+
+def test_classify_many_matches_per_node_classification(monkeypatch) -> None:
+    from tessrax.core import governance_kernel
+
+    # Pin the clock so per-call timestamps (and the digests over them) agree.
+    monkeypatch.setattr(governance_kernel, "_timestamp", lambda: "2024-01-01T00:00:00Z")
+    nodes = [
+        SimpleNamespace(id=1, url="https://example.org/", title="Home", state_hash="a" * 64),
+        SimpleNamespace(id=2, url="https://example.org/missing", title="404 Not Found", state_hash="b" * 64),
+        SimpleNamespace(id=None, url="https://example.org/pay", title="Button disabled", state_hash="c" * 64),
+    ]
+
+    assert classify_many(nodes) == [classify_contradiction(node) for node in nodes]
+    assert classify_many(iter(nodes), [0, 2, 5]) == [
+        classify_contradiction(node, recurrence_count=count) for node, count in zip(nodes, [0, 2, 5])
+    ]
+    with pytest.raises(ValueError):
+        classify_many(nodes, [1])
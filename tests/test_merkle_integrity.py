@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 import importlib
+import json
+import multiprocessing
 import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 from tessrax.memory.memory_engine import write_receipt
 from tessrax.ledger.merkle import MerkleAccumulator, verify_merkle
 
@@ -72,3 +79,144 @@ def test_merkle_state_matches_entries(tmp_path: Path) -> None:
     accumulator = MerkleAccumulator(state_path=core_memory.MERKLE_STATE_PATH)
     assert accumulator.state.entry_count == len(payloads)
     assert verify_merkle(core_memory.LEDGER_PATH, core_memory.MERKLE_STATE_PATH)
+
+
+def test_concurrent_receipts_keep_merkle_chain(tmp_path: Path, monkeypatch) -> None:
+    _bootstrap_paths(tmp_path)
+    fsyncs = []
+    real_fsync = os.fsync
+
+    def _slow_fsync(fd: int) -> None:
+        fsyncs.append(fd)
+        time.sleep(0.002)
+        real_fsync(fd)
+
+    monkeypatch.setattr(core_memory.os, "fsync", _slow_fsync)
+
+    def _write(worker: int) -> None:
+        for idx in range(4):
+            write_receipt(
+                event_type="STATE_AUDITED",
+                payload={"worker": worker, "node_id": idx},
+                audited_state_hash=f"{worker:032x}{idx:032x}",
+            )
+
+    threads = [threading.Thread(target=_write, args=(worker,)) for worker in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    accumulator = MerkleAccumulator(state_path=core_memory.MERKLE_STATE_PATH)
+    assert accumulator.state.entry_count == 64
+    assert verify_merkle(core_memory.LEDGER_PATH, core_memory.MERKLE_STATE_PATH)
+    # Writers that queue behind a flush share its fsync.
+    assert len(fsyncs) < 64
+    assert len(aion_verify.verify_local()) == 64
+
+
+def _write_receipts_in_process(worker: int) -> None:
+    for idx in range(8):
+        write_receipt(
+            event_type="STATE_AUDITED",
+            payload={"worker": worker, "node_id": idx},
+            audited_state_hash=f"{worker:032x}{idx:032x}",
+        )
+
+
+def test_multiprocess_receipts_keep_merkle_chain(tmp_path: Path) -> None:
+    _bootstrap_paths(tmp_path)
+    # Forked children inherit the sandbox paths set on the modules above.
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_write_receipts_in_process, args=(worker,)) for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 4
+
+    accumulator = MerkleAccumulator(state_path=core_memory.MERKLE_STATE_PATH)
+    assert accumulator.state.entry_count == 32
+    assert verify_merkle(core_memory.LEDGER_PATH, core_memory.MERKLE_STATE_PATH)
+
+
+def test_batched_signature_check_reports_earliest_bad_line(monkeypatch) -> None:
+    from nacl.signing import SigningKey
+
+    signing_key = SigningKey(bytes(range(32)))
+    verify_key = signing_key.verify_key
+    jobs = []
+    for line_no in range(1, 9):
+        message = f"entry-{line_no}".encode("utf-8")
+        signature = signing_key.sign(message).signature
+        if line_no in (3, 6):
+            message += b"-tampered"
+        jobs.append((line_no, verify_key, message, signature))
+
+    monkeypatch.setattr(aion_verify, "SIGNATURE_BATCH_SIZE", 1)
+    monkeypatch.setattr(aion_verify.os, "cpu_count", lambda: 4)
+    with pytest.raises(aion_verify.LedgerVerificationError, match="line 3: signature"):
+        aion_verify._verify_signatures(jobs)
+    aion_verify._verify_signatures([job for job in jobs if job[0] not in (3, 6)])
+
+
+def test_parallel_local_verification_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    _bootstrap_paths(tmp_path)
+    for idx in range(4):
+        write_receipt(
+            event_type="STATE_AUDITED",
+            payload={"node_id": idx, "status": "VERIFIED"},
+            audited_state_hash=f"{idx:064x}",
+        )
+
+    serial = aion_verify.verify_local()
+    monkeypatch.setattr(aion_verify, "PARALLEL_CHECK_MIN_LINES", 1)
+    monkeypatch.setattr(aion_verify.os, "cpu_count", lambda: 2)
+    assert aion_verify.verify_local() == serial
+
+
+def test_mixed_corruption_reports_earliest_line(tmp_path: Path, monkeypatch) -> None:
+    _bootstrap_paths(tmp_path)
+    for idx in range(4):
+        write_receipt(
+            event_type="STATE_AUDITED",
+            payload={"node_id": idx, "status": "VERIFIED"},
+            audited_state_hash=f"{idx:064x}",
+        )
+
+    entries = [json.loads(line) for line in core_memory.LEDGER_PATH.read_text().splitlines()]
+    entries[1]["signature"] = "00" * 64
+    entries[2]["payload"] = {"node_id": 99, "status": "TAMPERED"}
+    core_memory.LEDGER_PATH.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+    with pytest.raises(aion_verify.LedgerVerificationError, match="line 2: signature"):
+        aion_verify.verify_local()
+    monkeypatch.setattr(aion_verify, "PARALLEL_CHECK_MIN_LINES", 1)
+    monkeypatch.setattr(aion_verify.os, "cpu_count", lambda: 2)
+    with pytest.raises(aion_verify.LedgerVerificationError, match="line 2: signature"):
+        aion_verify.verify_local()
+
+
+def test_index_length_mismatch_outranks_content_mismatch(tmp_path: Path) -> None:
+    _bootstrap_paths(tmp_path)
+    for idx in range(3):
+        write_receipt(
+            event_type="STATE_AUDITED",
+            payload={"node_id": idx, "status": "VERIFIED"},
+            audited_state_hash=f"{idx:064x}",
+        )
+
+    con = sqlite3.connect(core_memory.INDEX_PATH)
+    with con:
+        con.execute(
+            "UPDATE ledger_index SET state_hash = ? WHERE ledger_offset = 0", ("f" * 64,)
+        )
+        con.execute(
+            "DELETE FROM ledger_index WHERE ledger_offset = (SELECT MAX(ledger_offset) FROM ledger_index)"
+        )
+    con.close()
+
+    with pytest.raises(aion_verify.LedgerVerificationError, match="length mismatch"):
+        aion_verify.verify_local()
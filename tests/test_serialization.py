@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import json
 import math
 
 import pytest
 
 from tessrax.core.serialization import (
     FrozenPayload,
+    canonical_json,
+    canonical_json_bytes,
     canonical_payload_hash,
     normalize_payload,
     snapshot_payload,
@@ -48,3 +51,26 @@ def test_snapshot_payload_is_immutable_and_hashable() -> None:
     digest = canonical_payload_hash(frozen)
     assert isinstance(digest, str)
     assert len(digest) == 64
+
+
+@pytest.mark.parametrize(
+    ("payload", "plain"),
+    [
+        (
+            {"b": 1, "a": [1.5, -0.0, 0.0001, 2**63], "é": {"z": None, "y": True}},
+            {"b": 1, "a": [1.5, -0.0, 0.0001, 2**63], "é": {"z": None, "y": True}},
+        ),
+        (
+            {"big": 2**70, "tiny": 1e-05, "huge": 1e16, "nan": math.nan},
+            {"big": 2**70, "tiny": 1e-05, "huge": 1e16, "nan": math.nan},
+        ),
+        (
+            {1: "int key", "nested": ({"t": (1, 2)},), "ctl": "\x00\x1f\u2028"},
+            {"1": "int key", "nested": [{"t": [1, 2]}], "ctl": "\x00\x1f\u2028"},
+        ),
+    ],
+)
+def test_canonical_json_matches_stdlib_encoding(payload, plain) -> None:
+    expected = json.dumps(plain, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    assert canonical_json(payload) == expected
+    assert canonical_json_bytes(payload) == expected.encode("utf-8")
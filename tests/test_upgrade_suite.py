@@ -1,6 +1,8 @@
 """Integration tests covering the Proceduralist upgrade suite."""
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import os
 import sqlite3
@@ -12,6 +14,7 @@ import pytest
 import tessrax.core.memory_engine as core_memory
 import tessrax.infra.key_registry as key_registry
 import tessrax.ledger.verify_ledger as ledger_module
+from tessrax.cli import tessraxctl
 from tessrax.core.typecheck import run_frozen_payload_typecheck
 from tessrax.diagnostics.auto_diag import auto_diagnose
 from tessrax.docs.diagram_generator import generate_diagram
@@ -169,6 +172,20 @@ def test_policy_registry_and_typecheck(tmp_path: Path) -> None:
     assert run_frozen_payload_typecheck() is True
 
 
+def test_policy_registry_sees_same_size_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "policy_state.json"
+    reader = PolicyRegistry(path=path)
+    writer = PolicyRegistry(path=path)
+    writer._save({"active_version": "v2.0", "history": []})
+    assert reader.active_version() == "v2.0"
+
+    before = path.stat()
+    writer._save({"active_version": "v2.1", "history": []})
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert path.stat().st_size == before.st_size
+    assert reader.active_version() == "v2.1"
+
+
 def test_multisig_rotation_and_token_guard(tmp_path: Path) -> None:
     env = _configure_environment(tmp_path)
     guard_path = env["merkle_path"].with_name("token_guard.json")
@@ -214,6 +231,12 @@ def test_cli_diff_and_rocks_backend(tmp_path: Path) -> None:
     )
     assert "payload_hash" in proc.stdout
 
+    # In process, stdout may be a text-only stream with no ``buffer``.
+    captured = io.StringIO()
+    with contextlib.redirect_stdout(captured):
+        tessraxctl.main(["diff-receipts", str(left), str(right)])
+    assert json.loads(captured.getvalue()) == json.loads(proc.stdout)
+
     rocks_backend = LedgerIndexBackend(
         index_path=tmp_path / "rocks.db",
         backend="rocksdb",